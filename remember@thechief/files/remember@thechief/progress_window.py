@@ -11,6 +11,7 @@ import json
 import os
 import sys
 import subprocess
+import tempfile
 import gettext
 import locale
 
@@ -46,19 +47,60 @@ STATUS_READY = 'ready'
 STATUS_TIMEOUT = 'timeout'
 STATUS_ERROR = 'error'
 
-# Status icons and colors
+# Status icons and text
 def get_status_info():
-    """Get translatable status info."""
+    """Get translatable status info as (icon name, text) per status."""
     return {
-        STATUS_SCHEDULED: ('⏰', _('Scheduled'), '#888888'),
-        STATUS_LAUNCHING: ('⏳', _('Launching...'), '#3584e4'),
-        STATUS_POSITIONING: ('📍', _('Positioning'), '#e5a50a'),
-        STATUS_READY: ('✓', _('Ready'), '#26a269'),
-        STATUS_TIMEOUT: ('⚠', _('Timeout'), '#e66100'),
-        STATUS_ERROR: ('✗', _('Error'), '#c01c28')
+        STATUS_SCHEDULED: ('alarm-symbolic', _('Scheduled')),
+        STATUS_LAUNCHING: ('process-working-symbolic', _('Launching...')),
+        STATUS_POSITIONING: ('find-location-symbolic', _('Positioning')),
+        STATUS_READY: ('emblem-ok-symbolic', _('Ready')),
+        STATUS_TIMEOUT: ('dialog-warning-symbolic', _('Timeout')),
+        STATUS_ERROR: ('dialog-error-symbolic', _('Error'))
     }
 
 
+# (icon name, text) per status (built once, reused per update)
+STATUS_DISPLAY = get_status_info()
+
+
+def write_file_atomic(path, data):
+    """Write text to path via a temp file in the same directory and rename"""
+    # Keep the target's permissions; mkstemp creates the temp file as 0600
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Map wmClass to friendly program names
+PROGRAM_NAME_MAP = {
+    'Brave-browser': 'Brave',
+    'Code': 'VS Code',
+    'Gnome-terminal': 'Terminal',
+    'SciTE': 'SciTE',
+    'WebApp-ChatGpt6946': 'ChatGPT',
+    'Nemo': 'Files',
+    'Firefox': 'Firefox',
+    'Google-chrome': 'Chrome',
+    'Thunderbird': 'Thunderbird'
+}
+
+
 class ProgressWindow(Gtk.Window):
     """Session restore progress window"""
 
@@ -67,6 +109,7 @@ class ProgressWindow(Gtk.Window):
 
         self.apps_to_launch = apps_to_launch
         self.instance_rows = {}  # instanceId -> tree_iter (for per-instance status updates)
+        self._last_status = {}  # instanceId -> last status written to the store
         self.show_setting = self._load_show_setting()
 
         self.set_default_size(800, 500)
@@ -105,10 +148,18 @@ class ProgressWindow(Gtk.Window):
         scrolled.set_vexpand(True)
 
         # TreeView for apps
-        # Columns: App Name, Details, Monitor, Workspace, Size, Status, wmClass (hidden)
-        self.store = Gtk.ListStore(str, str, str, str, str, str, str)
+        # Columns: App Name, Details, Monitor, Workspace, Size, Status, wmClass (hidden),
+        # Status icon name
+        self.store = Gtk.ListStore(str, str, str, str, str, str, str, str)
+
+        # Fill the store before attaching it so the view sees no per-row signals
+        self._populate_store()
+
         self.tree = Gtk.TreeView(model=self.store)
         self.tree.set_headers_visible(True)
+        # All rows are single-line text: let GTK skip per-row height
+        # measurement and only render the visible rows
+        self.tree.set_fixed_height_mode(True)
 
         # Columns in desired order: Name, Details, Monitor, Workspace, Size, Status
         cols = [
@@ -122,42 +173,25 @@ class ProgressWindow(Gtk.Window):
 
         for title, col_id, width in cols:
             renderer = Gtk.CellRendererText()
-            column = Gtk.TreeViewColumn(title, renderer, text=col_id)
+            column = Gtk.TreeViewColumn(title)
+            if col_id == 5:
+                # Status: themed icon followed by the status text
+                icon_renderer = Gtk.CellRendererPixbuf()
+                column.pack_start(icon_renderer, False)
+                column.add_attribute(icon_renderer, 'icon-name', 7)
+            column.pack_start(renderer, True)
+            column.add_attribute(renderer, 'text', col_id)
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            column.set_fixed_width(width)
             column.set_min_width(width)
             column.set_resizable(True)
+            if col_id == 1:
+                column.set_expand(True)  # Window title takes the remaining width
             self.tree.append_column(column)
 
         scrolled.add(self.tree)
         vbox.pack_start(scrolled, True, True, 0)
 
-        # Populate with initial apps
-        for item in self.apps_to_launch:
-            wm_class = item['wmClass']
-            instance = item['instance']
-            # Use instanceId for unique identification (falls back to wmClass if not present)
-            instance_id = item.get('instanceId', wm_class)
-
-            # Get program name (clean wmClass) and window details (title, truncated)
-            program_name = self._get_program_name(wm_class)
-            window_details = self._truncate_text(instance.get('title', '—'), 120)
-
-            # Monitor and workspace
-            monitor = f"M{instance.get('monitor_index', 0) + 1}"
-            workspace = f"WS{instance.get('workspace', 0) + 1}"
-
-            # Size
-            size = self._get_position_size_text(wm_class, instance)
-
-            # Initial status
-            icon, text, color = get_status_info()[STATUS_SCHEDULED]
-            status_text = f"{icon} {text}"
-
-            # Append in order: Program, Details, Monitor, Workspace, Size, Status, wmClass (hidden)
-            tree_iter = self.store.append([program_name, window_details, monitor, workspace, size, status_text, wm_class])
-
-            # Store tree_iter by instanceId for per-instance status updates
-            self.instance_rows[instance_id] = tree_iter
-
         # Separator
         sep2 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         vbox.pack_start(sep2, False, False, 0)
@@ -183,33 +217,105 @@ class ProgressWindow(Gtk.Window):
 
         self.add(vbox)
 
-        # Start periodic status file monitoring (every 50ms for fast updates)
-        GLib.timeout_add(50, self._check_status_file)
+        # Watch status file for updates from extension (inotify, no polling)
+        self._pending_reload = False
+        self._last_status_data = {}
+        status_file = Gio.File.new_for_path(PROGRESS_STATUS_FILE)
+        self._status_monitor = status_file.monitor_file(Gio.FileMonitorFlags.NONE, None)
+        self._status_monitor.connect("changed", self._on_status_file_changed)
+
+        # Pick up updates written before the monitor was installed
+        self._check_status_file()
+
+    def _populate_store(self):
+        """Populate the store with the initial apps"""
+        store_columns = list(range(self.store.get_n_columns()))
+        for item in self.apps_to_launch:
+            wm_class = item['wmClass']
+            instance = item['instance']
+            # Use instanceId for unique identification (falls back to wmClass if not present)
+            instance_id = item.get('instanceId', wm_class)
+
+            # Get program name (clean wmClass) and window details (title, truncated)
+            program_name = self._get_program_name(wm_class)
+            window_details = self._truncate_text(instance.get('title', '—'), 120)
+
+            # Monitor and workspace
+            monitor = f"M{instance.get('monitor_index', 0) + 1}"
+            workspace = f"WS{instance.get('workspace', 0) + 1}"
+
+            # Size
+            size = self._get_position_size_text(wm_class, instance)
+
+            # Initial status
+            status_icon, status_text = STATUS_DISPLAY[STATUS_SCHEDULED]
+
+            # Append in order: Program, Details, Monitor, Workspace, Size, Status, wmClass (hidden), Status icon
+            # (insert_with_valuesv avoids the per-value conversion of ListStore.append)
+            row = [program_name, window_details, monitor, workspace, size, status_text, wm_class, status_icon]
+            tree_iter = self.store.insert_with_valuesv(-1, store_columns, row)
+
+            # Store tree_iter by instanceId for per-instance status updates
+            self.instance_rows[instance_id] = tree_iter
+            self._last_status[instance_id] = STATUS_SCHEDULED
+
+    def _on_status_file_changed(self, monitor, gfile, other_file, event_type):
+        """Handle file monitor events for the status file"""
+        if event_type not in (Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+                              Gio.FileMonitorEvent.CREATED):
+            return
+
+        # Coalesce bursts of writes into a single reload per main loop iteration
+        if not self._pending_reload:
+            self._pending_reload = True
+            GLib.idle_add(self._reload_status_file, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _reload_status_file(self):
+        """Idle callback: re-read the status file once for all pending events"""
+        self._pending_reload = False
+        self._check_status_file()
+        return False
 
     def _check_status_file(self):
         """Check status file for updates from extension"""
         try:
-            if os.path.exists(PROGRESS_STATUS_FILE):
-                with open(PROGRESS_STATUS_FILE, 'r') as f:
-                    status_data = json.load(f)
-
-                # Status file now uses instanceId as key
-                for instance_id, info in status_data.items():
-                    if instance_id in self.instance_rows:
-                        # Update specific instance by its instanceId
-                        tree_iter = self.instance_rows[instance_id]
-                        self.update_status_by_iter(tree_iter, info['status'])
-
-        except json.JSONDecodeError as e:
-            # JSON parsing error - file might be mid-write, retry next poll
+            # Read on every change event: two rewrites within one tick of
+            # the coarse mtime clock can have the same mtime and size, so a
+            # stat comparison could drop the second one. The per-entry diff
+            # below already skips unchanged rows.
+            try:
+                with open(PROGRESS_STATUS_FILE, 'rb') as f:
+                    status_data = json.loads(f.read())
+            except FileNotFoundError:
+                return
+
+            # Status file now uses instanceId as key; only apply entries
+            # that changed since the last read
+            last_data = self._last_status_data
+            self._last_status_data = status_data
+            for instance_id, info in status_data.items():
+                if last_data.get(instance_id) == info:
+                    continue
+                if instance_id in self.instance_rows:
+                    # Skip rewrites of an unchanged status (e.g. timestamp-only updates)
+                    status = info['status']
+                    if self._last_status.get(instance_id) == status:
+                        continue
+                    self._last_status[instance_id] = status
+
+                    # Update specific instance by its instanceId
+                    tree_iter = self.instance_rows[instance_id]
+                    self.update_status_by_iter(tree_iter, status)
+
+        except json.JSONDecodeError:
+            # The extension replaces the file atomically, so this should not
+            # happen; the next change event reads it again
             pass
         except Exception as e:
             # Other errors - log but continue
             sys.stderr.write(f"[Progress Window] Error reading status file: {e}\n")
             sys.stderr.flush()
 
-        return True  # Keep timer running
-
     def _truncate_text(self, text, max_length=120):
         """Truncate text to max_length with ellipsis"""
         if not text or len(text) <= max_length:
@@ -218,19 +324,7 @@ class ProgressWindow(Gtk.Window):
 
     def _get_program_name(self, wm_class):
         """Get clean program name from wmClass"""
-        # Map wmClass to friendly names
-        name_map = {
-            'Brave-browser': 'Brave',
-            'Code': 'VS Code',
-            'Gnome-terminal': 'Terminal',
-            'SciTE': 'SciTE',
-            'WebApp-ChatGpt6946': 'ChatGPT',
-            'Nemo': 'Files',
-            'Firefox': 'Firefox',
-            'Google-chrome': 'Chrome',
-            'Thunderbird': 'Thunderbird'
-        }
-        return name_map.get(wm_class, wm_class)
+        return PROGRAM_NAME_MAP.get(wm_class, wm_class)
 
     def _get_position_size_text(self, wm_class, instance):
         """Get formatted position/size text from instance data"""
@@ -253,9 +347,8 @@ class ProgressWindow(Gtk.Window):
 
     def update_status_by_iter(self, tree_iter, status):
         """Update status for a specific tree_iter"""
-        icon, text, color = get_status_info().get(status, get_status_info()[STATUS_SCHEDULED])
-        status_text = f"{icon} {text}"
-        self.store.set_value(tree_iter, 5, status_text)
+        status_icon, status_text = STATUS_DISPLAY.get(status, STATUS_DISPLAY[STATUS_SCHEDULED])
+        self.store.set(tree_iter, [5, 7], [status_text, status_icon])
 
     def _on_checkbox_toggled(self, checkbox):
         """Handle checkbox toggle"""
@@ -268,27 +361,28 @@ class ProgressWindow(Gtk.Window):
             os.makedirs(CONFIG_DIR, exist_ok=True)
 
             # Load existing preferences
-            preferences = {}
-            if os.path.exists(PREFERENCES_FILE):
-                with open(PREFERENCES_FILE, 'r') as f:
-                    preferences = json.load(f)
+            try:
+                with open(PREFERENCES_FILE, 'rb') as f:
+                    preferences = json.loads(f.read())
+            except FileNotFoundError:
+                preferences = {}
 
             # Update showProgressWindow setting
             preferences['showProgressWindow'] = self.show_setting
 
-            # Save back
-            with open(PREFERENCES_FILE, 'w') as f:
-                json.dump(preferences, f, indent=2)
+            # Save back atomically so readers never see a partial file
+            write_file_atomic(PREFERENCES_FILE, json.dumps(preferences, indent=2))
         except Exception as e:
             print(f"Failed to save progress window setting: {e}")
 
     def _load_show_setting(self):
         """Load show setting from preferences.json"""
         try:
-            if os.path.exists(PREFERENCES_FILE):
-                with open(PREFERENCES_FILE, 'r') as f:
-                    preferences = json.load(f)
-                    return preferences.get("showProgressWindow", True)
+            with open(PREFERENCES_FILE, 'rb') as f:
+                preferences = json.loads(f.read())
+                return preferences.get("showProgressWindow", True)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Failed to load progress window setting: {e}")
         return True  # Default: show
@@ -4,6 +4,7 @@ Settings UI Package for Window Position Remember Extension
 This package provides a modular settings interface with:
 - css.py: GTK CSS styling
 - utils.py: Common utilities and helpers
+- idle_queue.py: Time-sliced idle work queue
 - app_config.py: Application session restore configuration
 - tabs/: Individual tab implementations
   - overview.py: Dashboard with stats and quick actions
@@ -4,15 +4,16 @@ About tab callbacks for Window Position Remember Extension Settings
 Handles button callbacks for opening external links
 """
 
-import subprocess
 import sys
 
+from gi.repository import Gio
+
 
 def openGitHub(widget=None):
     """Open the GitHub repository in default browser"""
     url = "https://github.com/carsteneu/remember"
     try:
-        subprocess.Popen(['xdg-open', url])
+        Gio.AppInfo.launch_default_for_uri(url, None)
     except Exception as e:
         print(f"Error opening GitHub: {e}", file=sys.stderr)
 
@@ -21,7 +22,7 @@ def openIssues(widget=None):
     """Open GitHub Issues page in default browser"""
     url = "https://github.com/carsteneu/remember/issues"
     try:
-        subprocess.Popen(['xdg-open', url])
+        Gio.AppInfo.launch_default_for_uri(url, None)
     except Exception as e:
         print(f"Error opening Issues: {e}", file=sys.stderr)
 
@@ -30,7 +31,7 @@ def openDocs(widget=None):
     """Open documentation (README) in default browser"""
     url = "https://github.com/carsteneu/remember#readme"
     try:
-        subprocess.Popen(['xdg-open', url])
+        Gio.AppInfo.launch_default_for_uri(url, None)
     except Exception as e:
         print(f"Error opening Docs: {e}", file=sys.stderr)
 
@@ -39,6 +40,6 @@ def openSponsor(widget=None):
     """Open sponsor website in default browser"""
     url = "https://example.com"  # Replace with actual sponsor URL
     try:
-        subprocess.Popen(['xdg-open', url])
+        Gio.AppInfo.launch_default_for_uri(url, None)
     except Exception as e:
         print(f"Error opening Sponsor: {e}", file=sys.stderr)
@@ -19,16 +19,53 @@ warnings.warn(
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, Gio
+import glob
 import json
+import mmap
 import os
+import re
 import subprocess
 
-from .utils import show_message, open_url
-import gettext
-
-# Translation function
-_ = gettext.gettext
+from .utils import show_message, open_url, atomic_write
+from .i18n import _
+
+# Files probed by the check_* methods
+VSCODE_SETTINGS_PATH = os.path.expanduser("~/.config/Code/User/settings.json")
+BRAVE_PREFS_PATH = os.path.expanduser("~/.config/BraveSoftware/Brave-Browser/Default/Preferences")
+CHROME_PREFS_PATH = os.path.expanduser("~/.config/google-chrome/Default/Preferences")
+FIREFOX_PROFILE_DIR = os.path.expanduser("~/.mozilla/firefox")
+
+# Firefox "restore previous session" pref inside user.js/prefs.js
+FIREFOX_RESTORE_PREF_RE = re.compile(rb'browser\.startup\.page"\s*,\s*3(?!\d)')
+
+# Chromium "session.restore_on_startup" value inside a Preferences file.
+# Anchored to the "session" object so that keys of the same name elsewhere
+# (e.g. in extension settings) do not match; [^{}] stops at nested objects,
+# in which case callers fall back to a full JSON parse.
+RESTORE_ON_STARTUP_RE = re.compile(rb'"session"\s*:\s*\{[^{}]*"restore_on_startup"\s*:\s*(\d+)')
+
+
+def read_restore_on_startup(prefs_path):
+    """Extract session.restore_on_startup from a Chromium Preferences file.
+
+    Preferences files can be several MB; instead of parsing the whole
+    document, the file is mapped and only the one value is searched for.
+    If the fast search finds nothing the file is parsed as JSON.
+    Returns 0 if the file or value is missing.
+    """
+    try:
+        with open(prefs_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = RESTORE_ON_STARTUP_RE.search(mm)
+                if match:
+                    return int(match.group(1))
+                prefs = json.loads(mm[:])
+        session = prefs.get('session') if isinstance(prefs, dict) else None
+        value = session.get('restore_on_startup', 0) if isinstance(session, dict) else 0
+        return value if isinstance(value, int) else 0
+    except (OSError, ValueError):
+        return 0
 
 
 class AppConfigurator:
@@ -36,38 +73,57 @@ class AppConfigurator:
 
     def __init__(self, parent_window):
         self.parent = parent_window
+        self._cache = {}     # check name -> cached result
+        self._monitors = {}  # check name -> list of Gio.FileMonitor
+
+    def _cached_check(self, name, paths, check_func):
+        """Return a cached check result, invalidated when any of paths changes."""
+        if name not in self._cache:
+            self._cache[name] = check_func()
+            if name not in self._monitors:
+                self._monitors[name] = [self._watch_file(path, name) for path in paths]
+        return self._cache[name]
+
+    def _watch_file(self, path, name):
+        """Drop the cached result for name whenever path changes."""
+        monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.NONE, None)
+        monitor.connect("changed", lambda *args: self._cache.pop(name, None))
+        return monitor
 
     # ========== VS Code ==========
 
     def check_vscode(self):
         """Check if VS Code is configured to restore windows."""
-        config_path = os.path.expanduser("~/.config/Code/User/settings.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r') as f:
-                    content = f.read()
-                    return '"window.restoreWindows": "all"' in content or '"window.restoreWindows":"all"' in content
-            except:
-                pass
+        return self._cached_check('vscode', [VSCODE_SETTINGS_PATH], self._read_vscode_state)
+
+    def _read_vscode_state(self):
+        """Read VS Code settings for the restoreWindows option."""
+        try:
+            with open(VSCODE_SETTINGS_PATH, 'r') as f:
+                content = f.read()
+                return '"window.restoreWindows": "all"' in content or '"window.restoreWindows":"all"' in content
+        except:
+            pass
         return False
 
     def configure_vscode(self, widget):
         """Configure VS Code to restore all windows."""
-        config_dir = os.path.expanduser("~/.config/Code/User")
-        config_path = os.path.join(config_dir, "settings.json")
+        config_path = VSCODE_SETTINGS_PATH
+        config_dir = os.path.dirname(config_path)
 
         try:
             os.makedirs(config_dir, exist_ok=True)
 
-            settings = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    settings = json.load(f)
+            try:
+                with open(config_path, 'rb') as f:
+                    settings = json.loads(f.read())
+            except FileNotFoundError:
+                settings = {}
 
             settings['window.restoreWindows'] = 'all'
 
             with open(config_path, 'w') as f:
-                json.dump(settings, f, indent=2)
+                f.write(json.dumps(settings, indent=2))
 
             show_message(self.parent, _("VS Code configured!"), _("VS Code will now restore all windows on startup."))
         except Exception as e:
@@ -81,15 +137,11 @@ class AppConfigurator:
 
     def check_brave(self):
         """Check if Brave is configured for session restore."""
-        prefs_path = os.path.expanduser("~/.config/BraveSoftware/Brave-Browser/Default/Preferences")
-        if os.path.exists(prefs_path):
-            try:
-                with open(prefs_path, 'r') as f:
-                    prefs = json.load(f)
-                    return prefs.get('session', {}).get('restore_on_startup', 0) == 1
-            except:
-                pass
-        return False
+        return self._cached_check('brave', [BRAVE_PREFS_PATH], self._read_brave_state)
+
+    def _read_brave_state(self):
+        """Read Brave preferences for the session restore option."""
+        return read_restore_on_startup(BRAVE_PREFS_PATH) == 1
 
     def configure_brave(self, widget):
         """Show instructions for Brave configuration."""
@@ -113,26 +165,49 @@ class AppConfigurator:
 
     def check_firefox(self):
         """Check if Firefox is configured for session restore."""
-        profile_dir = os.path.expanduser("~/.mozilla/firefox")
-        if os.path.exists(profile_dir):
-            for item in os.listdir(profile_dir):
-                if '.default' not in item:
-                    continue
-                for filename in ["user.js", "prefs.js"]:
-                    filepath = os.path.join(profile_dir, item, filename)
-                    if os.path.exists(filepath):
-                        try:
-                            with open(filepath, 'r') as f:
-                                content = f.read()
-                                if 'browser.startup.page", 3' in content:
-                                    return True
-                        except:
-                            pass
+        if 'firefox' in self._cache:
+            return self._cache['firefox']
+        if 'firefox_profiles' not in self._monitors:
+            # The pref file list depends on which profiles exist
+            monitor = Gio.File.new_for_path(FIREFOX_PROFILE_DIR).monitor_directory(
+                Gio.FileMonitorFlags.NONE, None)
+            monitor.connect("changed", self._on_firefox_profiles_changed)
+            self._monitors['firefox_profiles'] = [monitor]
+        pref_files = self._get_firefox_pref_files()
+        return self._cached_check('firefox', pref_files,
+                                  lambda: self._scan_firefox_profiles(pref_files))
+
+    def _on_firefox_profiles_changed(self, monitor, file, other_file, event_type):
+        """Rescan the profile list on the next check when a profile appears or goes away."""
+        if event_type not in (Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.DELETED):
+            return
+        for pref_monitor in self._monitors.pop('firefox', []):
+            pref_monitor.cancel()
+        self._cache.pop('firefox', None)
+
+    def _get_firefox_pref_files(self):
+        """List user.js/prefs.js paths of all default Firefox profiles."""
+        return [
+            os.path.join(profile_path, filename)
+            for profile_path in glob.glob(os.path.join(FIREFOX_PROFILE_DIR, '*.default*'))
+            for filename in ["user.js", "prefs.js"]
+        ]
+
+    def _scan_firefox_profiles(self, pref_files):
+        """Scan default profiles for the session restore pref."""
+        for filepath in pref_files:
+            try:
+                with open(filepath, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if FIREFOX_RESTORE_PREF_RE.search(mm):
+                            return True
+            except (OSError, ValueError):
+                pass
         return False
 
     def configure_firefox(self, widget):
         """Configure Firefox for session restore."""
-        profile_dir = os.path.expanduser("~/.mozilla/firefox")
+        profile_dir = FIREFOX_PROFILE_DIR
         if not os.path.exists(profile_dir):
             show_message(self.parent, _("Firefox not found"), _("Firefox profile directory not found."), Gtk.MessageType.WARNING)
             return
@@ -142,10 +217,11 @@ class AppConfigurator:
                 continue
             user_js_path = os.path.join(profile_dir, item, "user.js")
             try:
-                existing_content = ""
-                if os.path.exists(user_js_path):
+                try:
                     with open(user_js_path, 'r') as f:
                         existing_content = f.read()
+                except FileNotFoundError:
+                    existing_content = ""
 
                 if 'browser.startup.page", 3' in existing_content:
                     show_message(self.parent, _("Already configured"), _("Firefox session restore is already enabled."))
@@ -170,38 +246,47 @@ class AppConfigurator:
 
     def check_chrome(self):
         """Check if Chrome is configured for session restore."""
-        prefs_path = os.path.expanduser("~/.config/google-chrome/Default/Preferences")
-        if os.path.exists(prefs_path):
-            try:
-                with open(prefs_path, 'r') as f:
-                    prefs = json.load(f)
-                    return prefs.get('session', {}).get('restore_on_startup', 0) == 1
-            except:
-                pass
-        return False
+        return self._cached_check('chrome', [CHROME_PREFS_PATH], self._read_chrome_state)
+
+    def _read_chrome_state(self):
+        """Read Chrome preferences for the session restore option."""
+        return read_restore_on_startup(CHROME_PREFS_PATH) == 1
 
     def configure_chrome(self, widget):
         """Configure Chrome for session restore."""
-        prefs_path = os.path.expanduser("~/.config/google-chrome/Default/Preferences")
+        prefs_path = CHROME_PREFS_PATH
 
-        if not os.path.exists(prefs_path):
+        try:
+            with open(prefs_path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
             show_message(self.parent, _("Chrome not found"), _("Chrome preferences file not found."), Gtk.MessageType.WARNING)
             return
+        except Exception as e:
+            show_message(self.parent, _("Error"), _("Failed to configure Chrome: {0}").format(e), Gtk.MessageType.ERROR)
+            return
 
         try:
-            with open(prefs_path, 'r') as f:
-                prefs = json.load(f)
-
-            if prefs.get('session', {}).get('restore_on_startup', 0) == 1:
+            match = RESTORE_ON_STARTUP_RE.search(content)
+            if match and int(match.group(1)) == 1:
                 show_message(self.parent, _("Already configured"), _("Chrome session restore is already enabled."))
                 return
 
-            if 'session' not in prefs:
-                prefs['session'] = {}
-            prefs['session']['restore_on_startup'] = 1
+            if match:
+                # Patch the session value in place instead of re-serializing
+                content = content[:match.start(1)] + b'1' + content[match.end(1):]
+            else:
+                # Key missing or not found by the anchored search - rewrite
+                # the parsed document
+                prefs = json.loads(content)
+                session = prefs.setdefault('session', {})
+                if session.get('restore_on_startup') == 1:
+                    show_message(self.parent, _("Already configured"), _("Chrome session restore is already enabled."))
+                    return
+                session['restore_on_startup'] = 1
+                content = json.dumps(prefs, separators=(',', ':')).encode()
 
-            with open(prefs_path, 'w') as f:
-                json.dump(prefs, f, separators=(',', ':'))
+            atomic_write(prefs_path, content)
 
             show_message(
                 self.parent,
@@ -245,6 +330,8 @@ class AppConfigurator:
 
     def handle_switch_toggle(self, switch, state, configure_func, check_func):
         """Handle app config switch toggle."""
+        # The toggle may change the app's config - re-check on next call
+        self._cache.clear()
         if state:
             configure_func(switch)
             if check_func:
@@ -336,19 +336,39 @@ notebook > header > tabs > tab:checked {
     background: alpha(#9141ac, 0.2);
     color: #9141ac;
 }
+
+/* About tab content text (section titles stay at normal size) */
+label.about-content {
+    font-size: 0.9em;
+}
 """
 
+# The stylesheet stays inline rather than in a compiled GResource bundle:
+# GTK3 tokenizes CSS text on load either way, so a .gresource would only
+# add a build step without skipping the parse (done once per process below).
+CSS_BYTES = CSS_STYLES.encode('utf-8')
+
+# Parsed provider, added to the default screen once (shared by all windows)
+_provider = None
+
 
 def apply_css():
-    """Load and apply custom CSS to the application."""
-    css_provider = Gtk.CssProvider()
+    """Load and apply custom CSS to the application.
+
+    The CSS is parsed and added to the screen on the first call; later
+    calls do nothing.
+    """
+    global _provider
     try:
-        css_provider.load_from_data(CSS_STYLES.encode())
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        if _provider is None:
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(CSS_BYTES)
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            _provider = css_provider
         return True
     except Exception as e:
         print(f"CSS Error: {e}")
@@ -2,7 +2,8 @@
 Internationalization setup for settings UI.
 
 This module provides a centralized translation function that can be
-imported by all UI modules.
+imported by all UI modules. The text domain is bound and the catalog
+loaded lazily on the first translation, then reused for every call.
 """
 
 import gettext
@@ -11,11 +12,20 @@ import os
 UUID = "remember@thechief"
 locale_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "locale")
 
-# Bind the text domain
-gettext.bindtextdomain(UUID, locale_dir)
-gettext.textdomain(UUID)
+_translation = None
+
+
+def _get_translation():
+    """Bind the text domain and load the translation catalog once."""
+    global _translation
+    if _translation is None:
+        gettext.bindtextdomain(UUID, locale_dir)
+        gettext.textdomain(UUID)
+        _translation = gettext.translation(UUID, localedir=locale_dir, fallback=True)
+    return _translation
+
 
 # Translation function
 def _(message):
     """Translate a message using the extension's text domain."""
-    return gettext.dgettext(UUID, message)
+    return _get_translation().gettext(message)
@@ -0,0 +1,45 @@
+"""
+Idle work queue for settings UI.
+
+Runs queued callables from the GLib main loop in small time slices, so
+building many widgets does not block drawing and input for one long frame.
+"""
+
+import time
+from collections import deque
+
+from gi.repository import GLib
+
+
+class IdleQueue:
+    """Runs queued callables across idle callbacks with a per-tick time budget."""
+
+    def __init__(self, budget_ms=6):
+        self.budget_ns = budget_ms * 1_000_000
+        self._queue = deque()
+        self._source_id = None
+
+    def push(self, fn):
+        """Queue a callable; it runs on a later main loop iteration."""
+        self._queue.append(fn)
+        if self._source_id is None:
+            self._source_id = GLib.idle_add(self._pump)
+
+    def clear(self):
+        """Drop all queued callables that have not run yet."""
+        self._queue.clear()
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+    def _pump(self):
+        """Run queued callables until the budget for this tick is used up."""
+        start = time.monotonic_ns()
+        while self._queue:
+            fn = self._queue.popleft()
+            fn()
+            if self._queue and time.monotonic_ns() - start > self.budget_ns:
+                # Yield to the main loop, continue on the next idle tick
+                return True
+        self._source_id = None
+        return False
@@ -7,14 +7,21 @@ This is the main entry point that creates the settings window and manages tabs.
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gdk', '3.0')
-from gi.repository import Gtk, Gdk, GLib
+from gi.repository import Gtk, Gdk
 
 from .css import apply_css
 from .utils import DataManager, CONFIG_FILE
+from .plugin_handlers import CheckHandler, JsonLoader
+from .plugin_loader import get_shared_loader
 from .tabs import OverviewTab, WindowsTab, AppsSessionTab, PreferencesTab, AboutTab
 from .i18n import _
 
 
+# Keyboard shortcuts as (keyval, modifiers), parsed once
+ACCEL_CLOSE = Gtk.accelerator_parse("<Control>w")
+ACCEL_REFRESH = Gtk.accelerator_parse("<Control>r")
+
+
 class SettingsWindow(Gtk.Window):
     """Main settings window with modern, information-dense design."""
 
@@ -33,11 +40,22 @@ class SettingsWindow(Gtk.Window):
         # Position and size window
         self._position_window()
 
-        # Initialize data manager
+        # Initialize data manager; write a scheduled save before exiting
         self.data_manager = DataManager()
+        self.connect("destroy", self.data_manager.flush)
 
-        # Tab instances (stored for refresh)
+        # Tab instances (stored for refresh), built lazily on first view
         self.tab_instances = {}
+        self._tab_keys = []
+        # Built tabs whose content is stale after a refresh
+        self._dirty_tabs = set()
+        self._tab_factories = {
+            'overview': lambda: OverviewTab(self.data_manager, self, self._on_refresh),
+            'windows': lambda: WindowsTab(self.data_manager, self),
+            'apps': lambda: AppsSessionTab(self.data_manager, self),
+            'preferences': lambda: PreferencesTab(self.data_manager, self),
+            'about': lambda: AboutTab(self.data_manager, self),
+        }
 
         # Build UI
         self._build_ui()
@@ -47,15 +65,9 @@ class SettingsWindow(Gtk.Window):
 
     def _position_window(self):
         """Position window centered on screen."""
-        screen = self.get_screen()
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-
-        pos_x = (screen_width - self.WINDOW_WIDTH) // 2
-        pos_y = (screen_height - self.WINDOW_HEIGHT) // 2
-
         self.set_default_size(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
-        self.move(pos_x, pos_y)
+        # Let the window manager center it on the current monitor
+        self.set_position(Gtk.WindowPosition.CENTER)
 
     def _build_ui(self):
         """Build the main UI structure."""
@@ -65,6 +77,7 @@ class SettingsWindow(Gtk.Window):
         # Notebook for tabs
         self.notebook = Gtk.Notebook()
         self.notebook.set_tab_pos(Gtk.PositionType.TOP)
+        self.notebook.connect('switch-page', self._on_switch_page)
         main_box.pack_start(self.notebook, True, True, 0)
 
         # Build all tabs
@@ -75,33 +88,51 @@ class SettingsWindow(Gtk.Window):
         main_box.pack_start(bottom_bar, False, False, 0)
 
     def _build_tabs(self):
-        """Build all notebook tabs."""
-        # Tab 1: Overview & Control (Dashboard)
-        self.tab_instances['overview'] = OverviewTab(
-            self.data_manager, self, self._on_refresh
-        )
-        overview_page = self.tab_instances['overview'].create()
-        self.notebook.append_page(overview_page, Gtk.Label(label=_("Overview")))
-
-        # Tab 2: Windows (Consolidated Data View)
-        self.tab_instances['windows'] = WindowsTab(self.data_manager, self)
-        windows_page = self.tab_instances['windows'].create()
-        self.notebook.append_page(windows_page, Gtk.Label(label=_("Windows")))
-
-        # Tab 3: Applications & Session
-        self.tab_instances['apps'] = AppsSessionTab(self.data_manager, self)
-        apps_page = self.tab_instances['apps'].create()
-        self.notebook.append_page(apps_page, Gtk.Label(label=_("Apps & Session")))
-
-        # Tab 4: Preferences
-        self.tab_instances['preferences'] = PreferencesTab(self.data_manager, self)
-        prefs_page = self.tab_instances['preferences'].create()
-        self.notebook.append_page(prefs_page, Gtk.Label(label=_("Preferences")))
-
-        # Tab 5: About
-        self.tab_instances['about'] = AboutTab(self.data_manager, self)
-        about_page = self.tab_instances['about'].create()
-        self.notebook.append_page(about_page, Gtk.Label(label=_("settings-about-title")))
+        """Add all notebook tabs as empty placeholders.
+
+        Only the current page is built right away; the content of the
+        other tabs is created when they are first shown (see _on_switch_page).
+        """
+        tabs = [
+            ('overview', _("Overview")),                 # Tab 1: Dashboard
+            ('windows', _("Windows")),                   # Tab 2: Consolidated Data View
+            ('apps', _("Apps & Session")),               # Tab 3: Applications & Session
+            ('preferences', _("Preferences")),           # Tab 4: Preferences
+            ('about', _("settings-about-title")),        # Tab 5: About
+        ]
+        for key, label in tabs:
+            placeholder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+            placeholder.show()  # Notebook only switches to visible pages
+            self.notebook.append_page(placeholder, Gtk.Label(label=label))
+
+        # Set keys last so page switches while adding pages don't build tabs
+        self._tab_keys = [key for key, label in tabs]
+        self._ensure_tab_built(self.notebook.get_current_page())
+
+    def _ensure_tab_built(self, page_num):
+        """Create the content of a tab the first time it is needed."""
+        if page_num < 0 or page_num >= len(self._tab_keys):
+            return
+
+        key = self._tab_keys[page_num]
+        if key in self.tab_instances and key not in self._dirty_tabs:
+            return
+
+        # Fill the placeholder in place; the notebook page itself is kept
+        placeholder = self.notebook.get_nth_page(page_num)
+        for child in placeholder.get_children():
+            child.destroy()
+        self._dirty_tabs.discard(key)
+
+        tab = self._tab_factories[key]()
+        self.tab_instances[key] = tab
+        page = tab.create()
+        placeholder.pack_start(page, True, True, 0)
+        page.show_all()
+
+    def _on_switch_page(self, notebook, page, page_num):
+        """Build a tab's content when it is shown for the first time or is stale."""
+        self._ensure_tab_built(page_num)
 
     def _create_bottom_bar(self):
         """Create the bottom info bar with buttons."""
@@ -131,36 +162,27 @@ class SettingsWindow(Gtk.Window):
         self.add_accel_group(accel_group)
 
         # Ctrl+W to close
-        key, mod = Gtk.accelerator_parse("<Control>w")
-        accel_group.connect(key, mod, Gtk.AccelFlags.VISIBLE, lambda *args: self.destroy())
+        accel_group.connect(*ACCEL_CLOSE, Gtk.AccelFlags.VISIBLE, lambda *args: self.destroy())
 
         # Ctrl+R to refresh
-        key, mod = Gtk.accelerator_parse("<Control>r")
-        accel_group.connect(key, mod, Gtk.AccelFlags.VISIBLE, lambda *args: self._on_refresh())
+        accel_group.connect(*ACCEL_REFRESH, Gtk.AccelFlags.VISIBLE, lambda *args: self._on_refresh())
 
     def _on_refresh(self):
-        """Refresh data and rebuild tabs."""
+        """Refresh data and rebuild tabs.
+
+        Only the visible tab is rebuilt right away; the other built tabs
+        are marked stale and rebuilt when they are shown next.
+        """
         current_tab = self.notebook.get_current_page()
 
         # Reload data
         self.data_manager.reload()
+        CheckHandler.invalidate()
+        JsonLoader.clear()
+        get_shared_loader().reload()
 
-        # Clear tab instances
-        self.tab_instances.clear()
-
-        # Remove all tabs
-        while self.notebook.get_n_pages() > 0:
-            self.notebook.remove_page(0)
-
-        # Rebuild tabs
-        self._build_tabs()
-
-        # Show all new widgets first
-        self.notebook.show_all()
-
-        # Restore current tab AFTER show_all to ensure it stays
-        if current_tab >= 0 and current_tab < self.notebook.get_n_pages():
-            self.notebook.set_current_page(current_tab)
+        self._dirty_tabs = set(self.tab_instances)
+        self._ensure_tab_built(current_tab)
 
 
 def main():
@@ -169,7 +191,6 @@ def main():
     win.connect("destroy", Gtk.main_quit)
     win.show_all()
     win.present()
-    win.present_with_time(GLib.get_monotonic_time() // 1000)
     Gtk.main()
 
 
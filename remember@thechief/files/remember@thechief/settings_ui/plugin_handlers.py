@@ -8,15 +8,20 @@ application configurations.
 
 import os
 import json
+import mmap
 import subprocess
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple
-from gi.repository import GLib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from gi.repository import GLib, Gio
 
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
+from .utils import atomic_write
+
 
 class BaseHandler(ABC):
     """Base class for all handlers."""
@@ -31,6 +36,28 @@ class BaseHandler(ABC):
         pass
 
 
+_HOME = os.path.expanduser("~")
+
+
+@lru_cache(maxsize=512)
+def _expand(path: str) -> str:
+    """os.path.expanduser() for config paths, which repeat across refreshes."""
+    return os.path.expanduser(path)
+
+
+# Marks an absent key in dict.get() lookups (None can be a real value)
+_MISSING = object()
+
+# Results of file-based checks, keyed by CheckHandler.cache_key()
+_CHECK_CACHE: Dict[tuple, Tuple[bool, Optional[str]]] = {}
+
+
+def _file_state(path: str) -> tuple:
+    """Identify a file's current version (raises FileNotFoundError if missing)."""
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
 class CheckHandler(BaseHandler):
     """Base class for check handlers."""
 
@@ -39,12 +66,40 @@ class CheckHandler(BaseHandler):
         """Check if the condition is met."""
         pass
 
+    def cache_key(self) -> Optional[tuple]:
+        """Key for caching the check result, or None to always re-run.
+
+        File-based checks include the checked file's mtime in the key, so
+        a cached result is only reused while the file is unchanged. May
+        raise FileNotFoundError if the checked file does not exist.
+        """
+        return None
+
     def execute(self) -> Tuple[bool, Optional[str]]:
-        """Execute the check."""
+        """Execute the check, reusing the result for unchanged files."""
         try:
-            return self.check(), None
+            key = self.cache_key()
+        except FileNotFoundError:
+            return False, None
+        except OSError:
+            key = None
+
+        if key is not None and key in _CHECK_CACHE:
+            return _CHECK_CACHE[key]
+
+        try:
+            result = self.check(), None
         except Exception as e:
-            return False, str(e)
+            result = False, str(e)
+
+        if key is not None:
+            _CHECK_CACHE[key] = result
+        return result
+
+    @staticmethod
+    def invalidate():
+        """Drop all cached check results."""
+        _CHECK_CACHE.clear()
 
 
 class ConfigureHandler(BaseHandler):
@@ -63,6 +118,78 @@ class ConfigureHandler(BaseHandler):
             return False, str(e)
 
 
+# Files below this size are read directly; mapping them costs more than it saves
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _mmap_contains(path: str, pattern: bytes) -> bool:
+    """Search a file for a byte pattern without reading it into a string."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return not pattern
+        if size < _MMAP_MIN_SIZE:
+            return pattern in f.read()
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            return mm.find(pattern) != -1
+
+
+# Default profile directories per Firefox root: root -> (mtime_ns, profiles)
+_FIREFOX_PROFILES_CACHE: Dict[str, Tuple[int, list]] = {}
+
+
+def _firefox_profiles(root: str) -> list:
+    """Paths of the '.default' profiles below a Firefox root directory.
+
+    Creating or removing a profile changes the root's mtime, so the scan
+    is only repeated then. Raises FileNotFoundError if root is missing.
+    """
+    mtime = os.stat(root).st_mtime_ns
+    cached = _FIREFOX_PROFILES_CACHE.get(root)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(root) as entries:
+        profiles = [entry.path for entry in entries
+                    if '.default' in entry.name and entry.is_dir()]
+    _FIREFOX_PROFILES_CACHE[root] = (mtime, profiles)
+    return profiles
+
+
+class JsonLoader:
+    """Shared cache of parsed JSON files, keyed on path and mtime.
+
+    Several handlers may probe different keys of the same file; each
+    version of a file is only parsed once. Callers must not mutate the
+    returned data.
+    """
+
+    _cache: Dict[str, Tuple[tuple, Any]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> Any:
+        """Return the parsed content of path (raises OSError/JSONDecodeError)."""
+        state = _file_state(path)
+        cached = cls._cache.get(path)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        with open(path, 'rb') as f:
+            data = json.loads(f.read())
+        cls._cache[path] = (state, data)
+        return data
+
+    @classmethod
+    def invalidate(cls, path: str):
+        """Forget the cached content of a single file."""
+        cls._cache.pop(path, None)
+
+    @classmethod
+    def clear(cls):
+        """Forget all cached files."""
+        cls._cache.clear()
+
+
 # ============================================================================
 # Check Handlers
 # ============================================================================
@@ -71,25 +198,25 @@ class JsonKeyCheckHandler(CheckHandler):
     """Checks if a JSON file contains a specific key with a specific value."""
 
     def __init__(self, path: str, key: str, value: Any):
-        self.path = os.path.expanduser(path)
+        self.path = _expand(path)
         self.key = key
+        self._keys = tuple(key.split('.'))
         self.value = value
 
-    def check(self) -> bool:
-        if not os.path.exists(self.path):
-            return False
+    def cache_key(self) -> Optional[tuple]:
+        return (type(self).__name__, _file_state(self.path), self.key, repr(self.value))
 
+    def check(self) -> bool:
         try:
-            with open(self.path, 'r') as f:
-                data = json.load(f)
+            data = JsonLoader.load(self.path)
 
             # Navigate nested keys (e.g., "session.restore_on_startup")
-            keys = self.key.split('.')
             current = data
-            for k in keys:
-                if isinstance(current, dict) and k in current:
-                    current = current[k]
-                else:
+            for k in self._keys:
+                if not isinstance(current, dict):
+                    return False
+                current = current.get(k, _MISSING)
+                if current is _MISSING:
                     return False
 
             return current == self.value
@@ -101,17 +228,16 @@ class FileContainsCheckHandler(CheckHandler):
     """Checks if a file contains a specific pattern."""
 
     def __init__(self, path: str, pattern: str):
-        self.path = os.path.expanduser(path)
+        self.path = _expand(path)
         self.pattern = pattern
+        self._pat_bytes = pattern.encode('utf-8')
 
-    def check(self) -> bool:
-        if not os.path.exists(self.path):
-            return False
+    def cache_key(self) -> Optional[tuple]:
+        return (type(self).__name__, _file_state(self.path), self.pattern)
 
+    def check(self) -> bool:
         try:
-            with open(self.path, 'r') as f:
-                content = f.read()
-            return self.pattern in content
+            return _mmap_contains(self.path, self._pat_bytes)
         except IOError:
             return False
 
@@ -120,7 +246,7 @@ class FileExistsCheckHandler(CheckHandler):
     """Checks if a file exists."""
 
     def __init__(self, path: str):
-        self.path = os.path.expanduser(path)
+        self.path = _expand(path)
 
     def check(self) -> bool:
         return os.path.exists(self.path)
@@ -129,6 +255,8 @@ class FileExistsCheckHandler(CheckHandler):
 class CommandCheckHandler(CheckHandler):
     """Checks by running a command and examining its exit code."""
 
+    TIMEOUT = 10
+
     def __init__(self, cmd: list):
         self.cmd = cmd
 
@@ -136,13 +264,51 @@ class CommandCheckHandler(CheckHandler):
         try:
             result = subprocess.run(
                 self.cmd,
-                capture_output=True,
-                timeout=10
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=self.TIMEOUT
             )
             return result.returncode == 0
         except (subprocess.TimeoutExpired, OSError):
             return False
 
+    def execute_async(self, callback: Callable[[bool, Optional[str]], Any]):
+        """Run the command without blocking the main loop.
+
+        callback(success, error_message) is called from the main loop once
+        the command exits or is killed after TIMEOUT seconds.
+        """
+        try:
+            proc = Gio.Subprocess.new(
+                self.cmd,
+                Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE
+            )
+        except GLib.Error:
+            callback(False, None)
+            return
+        except Exception as e:
+            callback(False, str(e))
+            return
+
+        timeout = {'id': None}
+
+        def _on_timeout():
+            timeout['id'] = None
+            proc.force_exit()
+            return False
+
+        def _on_exit(p, result):
+            if timeout['id'] is not None:
+                GLib.source_remove(timeout['id'])
+            try:
+                p.wait_finish(result)
+                callback(p.get_successful(), None)
+            except GLib.Error:
+                callback(False, None)
+
+        timeout['id'] = GLib.timeout_add_seconds(self.TIMEOUT, _on_timeout)
+        proc.wait_async(None, _on_exit)
+
 
 class AlwaysTrueCheckHandler(CheckHandler):
     """Always returns True - for apps that auto-restore."""
@@ -156,22 +322,45 @@ class FirefoxProfileCheckHandler(CheckHandler):
 
     def __init__(self, pattern: str):
         self.pattern = pattern
-        self.profile_dir = os.path.expanduser("~/.mozilla/firefox")
+        self._pat_bytes = pattern.encode('utf-8')
+        self.profile_dir = os.path.join(_HOME, ".mozilla", "firefox")
 
-    def check(self) -> bool:
-        if not os.path.exists(self.profile_dir):
-            return False
+    PREF_FILES = ("user.js", "prefs.js")
+
+    def _pref_entries(self) -> list:
+        """Existing user.js/prefs.js entries of all default profiles."""
+        found = []
+        for profile in _firefox_profiles(self.profile_dir):
+            try:
+                with os.scandir(profile) as entries:
+                    by_name = {entry.name: entry for entry in entries
+                               if entry.name in self.PREF_FILES}
+            except OSError:
+                continue
+            found.extend(by_name[name] for name in self.PREF_FILES if name in by_name)
+        return found
 
+    def _pref_files(self) -> list:
+        """Existing user.js/prefs.js paths of all default profiles."""
+        return [entry.path for entry in self._pref_entries()]
+
+    def cache_key(self) -> Optional[tuple]:
+        # Stat'ing the candidates is much cheaper than searching them
+        states = []
+        for entry in self._pref_entries():
+            st = entry.stat()
+            states.append((entry.path, st.st_mtime_ns, st.st_size))
+        return (type(self).__name__, tuple(states), self.pattern)
+
+    def check(self) -> bool:
         try:
-            for item in os.listdir(self.profile_dir):
-                if '.default' not in item:
+            # prefs.js can be several MB - search it mapped, stop at first hit
+            for filepath in self._pref_files():
+                try:
+                    if _mmap_contains(filepath, self._pat_bytes):
+                        return True
+                except FileNotFoundError:
                     continue
-                for filename in ["user.js", "prefs.js"]:
-                    filepath = os.path.join(self.profile_dir, item, filename)
-                    if os.path.exists(filepath):
-                        with open(filepath, 'r') as f:
-                            if self.pattern in f.read():
-                                return True
         except IOError:
             pass
 
@@ -186,8 +375,9 @@ class JsonSetConfigureHandler(ConfigureHandler):
     """Sets a JSON key to a specific value."""
 
     def __init__(self, path: str, key: str, value: Any):
-        self.path = os.path.expanduser(path)
+        self.path = _expand(path)
         self.key = key
+        self._keys = tuple(key.split('.'))
         self.value = value
 
     def configure(self) -> bool:
@@ -196,25 +386,24 @@ class JsonSetConfigureHandler(ConfigureHandler):
 
         # Load existing data or start fresh
         data = {}
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, 'r') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            with open(self.path, 'rb') as f:
+                data = json.loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            pass
 
         # Navigate/create nested keys
-        keys = self.key.split('.')
         current = data
-        for k in keys[:-1]:
+        for k in self._keys[:-1]:
             if k not in current:
                 current[k] = {}
             current = current[k]
-        current[keys[-1]] = self.value
+        current[self._keys[-1]] = self.value
 
-        # Write back
-        with open(self.path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write back in one call via temp file + rename, so the app never
+        # sees a half-written config
+        atomic_write(self.path, json.dumps(data, indent=2).encode('utf-8'))
+        JsonLoader.invalidate(self.path)
 
         return True
 
@@ -223,7 +412,7 @@ class FileAppendConfigureHandler(ConfigureHandler):
     """Appends content to a file."""
 
     def __init__(self, path: str, content: str, check_pattern: Optional[str] = None):
-        self.path = os.path.expanduser(path)
+        self.path = _expand(path)
         self.content = content
         self.check_pattern = check_pattern
 
@@ -255,7 +444,8 @@ class CommandConfigureHandler(ConfigureHandler):
         try:
             result = subprocess.run(
                 self.cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30
             )
             return result.returncode == 0
@@ -298,26 +488,27 @@ class FirefoxConfigureHandler(ConfigureHandler):
         self.check_pattern = check_pattern
         # Check both common Firefox profile locations
         self.profile_dirs = [
-            os.path.expanduser("~/.mozilla/firefox"),
-            os.path.expanduser("~/.config/mozilla/firefox")
+            os.path.join(_HOME, ".mozilla", "firefox"),
+            os.path.join(_HOME, ".config", "mozilla", "firefox")
         ]
 
     def configure(self) -> bool:
         for profile_dir in self.profile_dirs:
-            if not os.path.exists(profile_dir):
+            try:
+                profiles = _firefox_profiles(profile_dir)
+            except FileNotFoundError:
                 continue
 
-            for item in os.listdir(profile_dir):
-                if '.default' not in item:
-                    continue
-
-                user_js_path = os.path.join(profile_dir, item, "user.js")
+            for profile in profiles:
+                user_js_path = os.path.join(profile, "user.js")
 
                 # Check if already configured
-                if os.path.exists(user_js_path):
+                try:
                     with open(user_js_path, 'r') as f:
                         if self.check_pattern in f.read():
                             return True
+                except FileNotFoundError:
+                    pass
 
                 # Write configuration (overwrite to ensure clean state)
                 with open(user_js_path, 'w') as f:
@@ -356,6 +547,72 @@ class OpenSettingsHandler(ConfigureHandler):
 # Handler Factory
 # ============================================================================
 
+# Shared pool for running checks off the GTK main loop (created on first use)
+_CHECK_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_check_executor() -> ThreadPoolExecutor:
+    global _CHECK_EXECUTOR
+    if _CHECK_EXECUTOR is None:
+        _CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='plugin-check')
+    return _CHECK_EXECUTOR
+
+
+# Check handler builders by config type
+_CHECK_HANDLERS: Dict[str, Callable[[Dict], CheckHandler]] = {
+    'json_key': lambda config: JsonKeyCheckHandler(
+        path=config.get('path', ''),
+        key=config.get('key', ''),
+        value=config.get('value')
+    ),
+    'file_contains': lambda config: FileContainsCheckHandler(
+        path=config.get('path', ''),
+        pattern=config.get('pattern', '')
+    ),
+    'file_exists': lambda config: FileExistsCheckHandler(
+        path=config.get('path', '')
+    ),
+    'command': lambda config: CommandCheckHandler(
+        cmd=config.get('cmd', [])
+    ),
+    'always_true': lambda config: AlwaysTrueCheckHandler(),
+    'firefox_profile': lambda config: FirefoxProfileCheckHandler(
+        pattern=config.get('pattern', '')
+    ),
+}
+
+# Configure handler builders by config type
+_CONFIGURE_HANDLERS: Dict[str, Callable[[Dict, Any], ConfigureHandler]] = {
+    'json_set': lambda config, parent: JsonSetConfigureHandler(
+        path=config.get('path', ''),
+        key=config.get('key', ''),
+        value=config.get('value')
+    ),
+    'file_append': lambda config, parent: FileAppendConfigureHandler(
+        path=config.get('path', ''),
+        content=config.get('content', ''),
+        check_pattern=config.get('checkPattern')
+    ),
+    'command': lambda config, parent: CommandConfigureHandler(
+        cmd=config.get('cmd', [])
+    ),
+    'manual': lambda config, parent: ManualConfigureHandler(
+        message=config.get('message', ''),
+        parent_window=parent
+    ),
+    # Support both prefLine (string) and prefLines (array)
+    'firefox': lambda config, parent: FirefoxConfigureHandler(
+        pref_lines=config.get('prefLines', config.get('prefLine', '')),
+        check_pattern=config.get('checkPattern', '')
+    ),
+    'url': lambda config, parent: OpenSettingsHandler(
+        type_='url',
+        target=config.get('url', config.get('target', ''))
+    ),
+}
+_CONFIGURE_HANDLERS['open_settings'] = _CONFIGURE_HANDLERS['url']
+
+
 class HandlerFactory:
     """Factory for creating handlers from config definitions."""
 
@@ -365,35 +622,8 @@ class HandlerFactory:
         if not config:
             return None
 
-        handler_type = config.get('type')
-
-        if handler_type == 'json_key':
-            return JsonKeyCheckHandler(
-                path=config.get('path', ''),
-                key=config.get('key', ''),
-                value=config.get('value')
-            )
-        elif handler_type == 'file_contains':
-            return FileContainsCheckHandler(
-                path=config.get('path', ''),
-                pattern=config.get('pattern', '')
-            )
-        elif handler_type == 'file_exists':
-            return FileExistsCheckHandler(
-                path=config.get('path', '')
-            )
-        elif handler_type == 'command':
-            return CommandCheckHandler(
-                cmd=config.get('cmd', [])
-            )
-        elif handler_type == 'always_true':
-            return AlwaysTrueCheckHandler()
-        elif handler_type == 'firefox_profile':
-            return FirefoxProfileCheckHandler(
-                pattern=config.get('pattern', '')
-            )
-
-        return None
+        build = _CHECK_HANDLERS.get(config.get('type'))
+        return build(config) if build else None
 
     @staticmethod
     def create_configure_handler(config: Dict, parent_window=None) -> Optional[ConfigureHandler]:
@@ -401,43 +631,34 @@ class HandlerFactory:
         if not config:
             return None
 
-        handler_type = config.get('type')
+        build = _CONFIGURE_HANDLERS.get(config.get('type'))
+        return build(config, parent_window) if build else None
 
-        if handler_type == 'json_set':
-            return JsonSetConfigureHandler(
-                path=config.get('path', ''),
-                key=config.get('key', ''),
-                value=config.get('value')
-            )
-        elif handler_type == 'file_append':
-            return FileAppendConfigureHandler(
-                path=config.get('path', ''),
-                content=config.get('content', ''),
-                check_pattern=config.get('checkPattern')
-            )
-        elif handler_type == 'command':
-            return CommandConfigureHandler(
-                cmd=config.get('cmd', [])
-            )
-        elif handler_type == 'manual':
-            return ManualConfigureHandler(
-                message=config.get('message', ''),
-                parent_window=parent_window
-            )
-        elif handler_type == 'firefox':
-            # Support both prefLine (string) and prefLines (array)
-            pref_lines = config.get('prefLines', config.get('prefLine', ''))
-            return FirefoxConfigureHandler(
-                pref_lines=pref_lines,
-                check_pattern=config.get('checkPattern', '')
-            )
-        elif handler_type == 'url' or handler_type == 'open_settings':
-            return OpenSettingsHandler(
-                type_='url',
-                target=config.get('url', config.get('target', ''))
-            )
+    @staticmethod
+    def run_checks_async(handlers: List[CheckHandler],
+                         on_done: Callable[[CheckHandler, Optional[bool], Optional[str]], Any]):
+        """Run check handlers in a worker pool.
 
-        return None
+        on_done(handler, is_configured, error) is called from the GTK main
+        loop as each check finishes. is_configured is None if the handler
+        itself raised.
+        """
+        executor = _get_check_executor()
+
+        def _finished(handler, future):
+            try:
+                ok, err = future.result()
+            except Exception as e:
+                ok, err = None, str(e)
+            GLib.idle_add(on_done, handler, ok, err)
+
+        for handler in handlers:
+            if hasattr(handler, 'execute_async'):
+                # Already non-blocking, no worker thread needed
+                handler.execute_async(lambda ok, err, h=handler: on_done(h, ok, err))
+                continue
+            future = executor.submit(handler.execute)
+            future.add_done_callback(lambda f, h=handler: _finished(h, f))
 
     @staticmethod
     def create_open_settings_handler(config: Dict) -> Optional[OpenSettingsHandler]:
@@ -7,12 +7,45 @@ them to the Settings UI for dynamic rendering.
 
 import os
 import json
-from typing import Dict, List, Optional, Any
+import re
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from gi.repository import GLib
 
+# Plugin configs are a few KB; one read of this size usually gets all of it
+CONFIG_READ_SIZE = 64 * 1024
 
-@dataclass
+
+def _read_small_file(path: str) -> bytes:
+    """Read a whole file with raw os.read() calls, skipping buffered IO setup."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, CONFIG_READ_SIZE)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+# conditionalFlags keys with this prefix get an auto-generated setting
+LAUNCH_FLAG_PREFIX = 'launchFlags.'
+
+# camelCase word boundary, for generated launch flag labels
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+
+# Slotted dataclasses drop the per-instance __dict__ (needs Python 3.10+)
+if sys.version_info >= (3, 10):
+    _record = dataclass(slots=True)
+else:
+    _record = dataclass
+
+
+@_record
 class PluginSetting:
     """Represents a single plugin setting."""
     key: str
@@ -27,7 +60,7 @@ class PluginSetting:
     default: Any = None
 
 
-@dataclass
+@_record
 class PluginConfig:
     """Represents a loaded plugin configuration."""
     name: str
@@ -41,6 +74,8 @@ class PluginConfig:
     executables: List[str] = field(default_factory=list)
     flags: List[str] = field(default_factory=list)
     conditional_flags: Dict[str, List[str]] = field(default_factory=dict)
+    # Setting keys of the launchFlags.* conditional flags, in file order
+    launch_flag_keys: Tuple[str, ...] = ()
 
     # Features
     is_single_instance: bool = False
@@ -72,31 +107,88 @@ class PluginLoader:
 
     def __init__(self):
         self._plugins: Dict[str, PluginConfig] = {}
+        # Read-only views, rebuilt on every load
+        self._plugins_view: Mapping[str, PluginConfig] = MappingProxyType(self._plugins)
+        self._with_settings: Mapping[str, PluginConfig] = MappingProxyType({})
+        self._by_type: Dict[str, Mapping[str, PluginConfig]] = {}
+        self._sorted: Optional[List[PluginConfig]] = None
         self._loaded = False
-
-    def get_plugin_directories(self) -> List[str]:
-        """Get list of plugin directories to scan."""
-        dirs = []
-
-        # Extension plugins (primary)
-        if os.path.isdir(self.EXTENSION_PLUGIN_PATH):
-            dirs.append(self.EXTENSION_PLUGIN_PATH)
-
-        # User plugins (override/custom)
-        if os.path.isdir(self.USER_PLUGIN_PATH):
-            dirs.append(self.USER_PLUGIN_PATH)
-
-        return dirs
+        # Parsed configs by config.json path with their file signature,
+        # reused by reload() for plugins that did not change
+        self._entries: Dict[str, Tuple[tuple, Optional[PluginConfig]]] = {}
+
+    def _iter_plugin_config_files(self) -> Iterator[Tuple[str, str]]:
+        """Yield (config_path, plugin_path) for every plugin directory.
+
+        Extension plugins come first, so user plugins override them.
+        Missing plugin roots are skipped.
+        """
+        for base_dir in (self.EXTENSION_PLUGIN_PATH, self.USER_PLUGIN_PATH):
+            try:
+                with os.scandir(base_dir) as entries:
+                    # is_dir() is answered from the directory listing itself
+                    plugin_paths = [entry.path for entry in entries if entry.is_dir()]
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Error scanning plugin directory {base_dir}: {e}")
+                continue
+
+            for plugin_path in plugin_paths:
+                yield os.path.join(plugin_path, 'config.json'), plugin_path
 
     def load_all(self) -> Dict[str, PluginConfig]:
-        """Load all plugin configurations from plugin directories."""
+        """Load all plugin configurations from plugin directories.
+
+        Configs whose file signature matches an earlier load are reused
+        without parsing.
+        """
         if self._loaded:
             return self._plugins
 
         self._plugins = {}
-
-        for plugin_dir in self.get_plugin_directories():
-            self._scan_plugin_directory(plugin_dir)
+        cache = self._entries
+        new_cache = {}
+
+        candidates = []
+        for config_file, plugin_path in self._iter_plugin_config_files():
+            try:
+                st = os.stat(config_file)
+            except OSError:
+                continue
+            candidates.append((config_file, plugin_path, (st.st_mtime_ns, st.st_size)))
+
+        stale = [
+            (config_file, plugin_path)
+            for config_file, plugin_path, signature in candidates
+            if config_file not in cache or cache[config_file][0] != signature
+        ]
+        parsed = self._bulk_load_configs(stale)
+
+        # Apply in scan order so user plugins override extension plugins
+        for config_file, plugin_path, signature in candidates:
+            if config_file in parsed:
+                config = parsed[config_file]
+            else:
+                config = cache[config_file][1]
+            new_cache[config_file] = (signature, config)
+
+            if config:
+                self._plugins[config.name] = config
+
+        self._entries = new_cache
+
+        self._sorted = None
+        self._plugins_view = MappingProxyType(self._plugins)
+        self._with_settings = MappingProxyType({
+            name: config
+            for name, config in self._plugins.items()
+            if config.settings or config.conditional_flags
+        })
+        by_type = {}
+        for name, config in self._plugins.items():
+            by_type.setdefault(config.plugin_type, {})[name] = config
+        self._by_type = {t: MappingProxyType(plugins) for t, plugins in by_type.items()}
 
         self._loaded = True
         return self._plugins
@@ -107,29 +199,25 @@ class PluginLoader:
         self._plugins = {}
         return self.load_all()
 
-    def _scan_plugin_directory(self, base_dir: str):
-        """Scan a plugin directory for plugin configurations."""
+    def _bulk_load_configs(self, pairs: List[Tuple[str, str]]) -> Dict[str, Optional[PluginConfig]]:
+        """Load several (config_file, plugin_path) pairs, keyed by config_file."""
+        return {config_file: self._try_load_plugin_config(config_file, plugin_path)
+                for config_file, plugin_path in pairs}
+
+    def _try_load_plugin_config(self, config_file: str, plugin_path: str) -> Optional[PluginConfig]:
+        """Load a plugin configuration, reporting errors instead of raising."""
         try:
-            for item in os.listdir(base_dir):
-                plugin_path = os.path.join(base_dir, item)
-                config_file = os.path.join(plugin_path, 'config.json')
-
-                if os.path.isdir(plugin_path) and os.path.exists(config_file):
-                    try:
-                        config = self._load_plugin_config(config_file, plugin_path)
-                        if config:
-                            # User plugins override extension plugins
-                            self._plugins[config.name] = config
-                    except Exception as e:
-                        print(f"Error loading plugin {item}: {e}")
+            return self._load_plugin_config(config_file, plugin_path)
         except Exception as e:
-            print(f"Error scanning plugin directory {base_dir}: {e}")
+            print(f"Error loading plugin {os.path.basename(plugin_path)}: {e}")
+            return None
 
     def _load_plugin_config(self, config_file: str, plugin_path: str) -> Optional[PluginConfig]:
         """Load a single plugin configuration from config.json."""
         try:
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            # loads() on raw bytes; json.load() would go through a buffered
+            # text decoder
+            data = json.loads(_read_small_file(config_file))
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error reading {config_file}: {e}")
             return None
@@ -149,16 +237,34 @@ class PluginLoader:
         # Extract features
         features = data.get('features', {})
 
-        # Parse settings block
-        settings = {}
-        settings_data = data.get('settings', {})
-        for key, setting_data in settings_data.items():
-            settings[key] = self._parse_setting(key, setting_data)
+        # Parse settings block (positional args follow PluginSetting's field order).
+        # Type names come from a small fixed set; interning shares one string
+        # object per name across all plugins.
+        settings = {
+            key: PluginSetting(
+                key,
+                sys.intern(s.get('type', 'boolean')),
+                s.get('label', key),
+                s.get('description', ''),
+                s.get('check'),
+                s.get('configure'),
+                s.get('unconfigure'),
+                s.get('openSettings'),
+                s.get('options'),
+                s.get('default')
+            )
+            for key, s in data.get('settings', {}).items()
+        }
 
-        # Auto-generate launch flag settings from conditionalFlags
-        for flag_key, flags in conditional_flags.items():
-            if flag_key.startswith('launchFlags.'):
-                setting_key = flag_key.replace('launchFlags.', '')
+        # Auto-generate launch flag settings from conditionalFlags (most
+        # plugins have none)
+        launch_flag_keys = []
+        if conditional_flags:
+            for flag_key, flags in conditional_flags.items():
+                if not flag_key.startswith(LAUNCH_FLAG_PREFIX):
+                    continue
+                setting_key = flag_key[len(LAUNCH_FLAG_PREFIX):]
+                launch_flag_keys.append(setting_key)
                 if setting_key not in settings:
                     # Auto-generate a boolean setting for this launch flag
                     settings[setting_key] = PluginSetting(
@@ -175,10 +281,11 @@ class PluginLoader:
             description=data.get('description', ''),
             version=data.get('version', '1.0.0'),
             wm_class=data.get('wmClass', []),
-            plugin_type=data.get('type', ''),
+            plugin_type=sys.intern(data.get('type', '')),
             executables=launch.get('executables', []),
             flags=launch.get('flags', []),
             conditional_flags=conditional_flags,
+            launch_flag_keys=tuple(launch_flag_keys),
             is_single_instance=features.get('isSingleInstance', False),
             auto_restore=features.get('autoRestore', False),
             needs_config_manipulation=features.get('needsConfigManipulation', False),
@@ -189,58 +296,48 @@ class PluginLoader:
 
         return config
 
-    def _parse_setting(self, key: str, data: Dict) -> PluginSetting:
-        """Parse a setting definition from config.json."""
-        return PluginSetting(
-            key=key,
-            type=data.get('type', 'boolean'),
-            label=data.get('label', key),
-            description=data.get('description', ''),
-            check=data.get('check'),
-            configure=data.get('configure'),
-            unconfigure=data.get('unconfigure'),
-            open_settings=data.get('openSettings'),
-            options=data.get('options'),
-            default=data.get('default')
-        )
-
     def _generate_flag_label(self, flag_key: str) -> str:
         """Generate a human-readable label from a flag key."""
         # browserSessionRestore -> Browser Session Restore
-        import re
-        # Split on camelCase boundaries
-        words = re.sub(r'([a-z])([A-Z])', r'\1 \2', flag_key)
-        return words.title()
+        return _CAMEL_RE.sub(r'\1 \2', flag_key).title()
 
-    def get_plugins_with_settings(self) -> Dict[str, PluginConfig]:
-        """Get only plugins that have settings or conditional flags."""
+    def get_plugins_with_settings(self) -> Mapping[str, PluginConfig]:
+        """Get only plugins that have settings or conditional flags (read-only)."""
         self.load_all()
-        return {
-            name: config
-            for name, config in self._plugins.items()
-            if config.settings or config.conditional_flags
-        }
+        return self._with_settings
 
-    def get_all_plugins(self) -> Dict[str, PluginConfig]:
-        """Get all loaded plugins."""
+    def get_all_plugins(self) -> Mapping[str, PluginConfig]:
+        """Get all loaded plugins (read-only)."""
         self.load_all()
-        return self._plugins
+        return self._plugins_view
 
     def get_plugin(self, name: str) -> Optional[PluginConfig]:
         """Get a specific plugin by name."""
         self.load_all()
         return self._plugins.get(name)
 
-    def get_plugins_by_type(self, plugin_type: str) -> Dict[str, PluginConfig]:
-        """Get plugins filtered by type (e.g., 'chromium-browser', 'editor')."""
+    def get_plugins_by_type(self, plugin_type: str) -> Mapping[str, PluginConfig]:
+        """Get plugins filtered by type (e.g., 'chromium-browser', 'editor'), read-only."""
         self.load_all()
-        return {
-            name: config
-            for name, config in self._plugins.items()
-            if config.plugin_type == plugin_type
-        }
+        return self._by_type.get(plugin_type, MappingProxyType({}))
 
     def get_sorted_plugins(self) -> List[PluginConfig]:
-        """Get all plugins sorted by display name."""
+        """Get all plugins sorted by display name (shared list, do not modify)."""
         self.load_all()
-        return sorted(self._plugins.values(), key=lambda p: p.display_name.lower())
+        if self._sorted is None:
+            self._sorted = sorted(self._plugins.values(), key=lambda p: p.display_name.lower())
+        return self._sorted
+
+
+_SHARED_LOADER: Optional[PluginLoader] = None
+
+
+def get_shared_loader() -> PluginLoader:
+    """Get the process-wide PluginLoader, so plugins are scanned only once.
+
+    Call reload() on it to pick up changes on disk.
+    """
+    global _SHARED_LOADER
+    if _SHARED_LOADER is None:
+        _SHARED_LOADER = PluginLoader()
+    return _SHARED_LOADER
@@ -4,14 +4,230 @@ About Tab - Extension information, credits, and support links
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
-import subprocess
+gi.require_version('Gdk', '3.0')
+from gi.repository import Gtk, Gdk, GLib, Pango
 import sys
 
 from ..utils import WidgetFactory
 from ..i18n import _
 
 
+# Static layout of the About tab; texts are translated and set in create()
+ABOUT_UI_XML = """
+<interface>
+  <object class="GtkBox" id="main_box">
+    <property name="orientation">vertical</property>
+    <property name="margin-start">16</property>
+    <property name="margin-end">16</property>
+    <property name="margin-top">16</property>
+    <property name="margin-bottom">16</property>
+    <child>
+      <object class="GtkScrolledWindow">
+        <property name="hscrollbar-policy">never</property>
+        <property name="vscrollbar-policy">automatic</property>
+        <child>
+          <object class="GtkBox">
+            <property name="orientation">vertical</property>
+            <property name="spacing">16</property>
+            <child>
+              <object class="GtkBox">
+                <property name="orientation">horizontal</property>
+                <property name="spacing">16</property>
+                <child>
+                  <object class="GtkFrame">
+                    <style><class name="card"/></style>
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">8</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">8</property>
+                        <property name="margin-bottom">8</property>
+                        <child>
+                          <object class="GtkLabel" id="info_title">
+                            <property name="halign">start</property>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="info_description">
+                            <property name="xalign">0</property>
+                            <property name="wrap">True</property>
+                            <style><class name="about-content"/></style>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkSeparator">
+                            <property name="orientation">horizontal</property>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property><property name="padding">4</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="info_version">
+                            <property name="xalign">0</property>
+                            <property name="wrap">True</property>
+                            <property name="selectable">True</property>
+                            <style><class name="about-content"/></style>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkSeparator">
+                            <property name="orientation">horizontal</property>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property><property name="padding">6</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="info_author">
+                            <property name="xalign">0</property>
+                            <property name="wrap">True</property>
+                            <property name="selectable">True</property>
+                            <style><class name="about-content"/></style>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                  <packing><property name="expand">True</property><property name="fill">True</property></packing>
+                </child>
+                <child>
+                  <object class="GtkFrame">
+                    <style><class name="card"/></style>
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">8</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">8</property>
+                        <property name="margin-bottom">8</property>
+                        <child>
+                          <object class="GtkLabel" id="credits_title">
+                            <property name="halign">start</property>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="credits_sponsor">
+                            <property name="xalign">0</property>
+                            <property name="wrap">True</property>
+                            <property name="use-markup">True</property>
+                            <signal name="activate-link" handler="_on_link_clicked"/>
+                            <style><class name="about-content"/></style>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkSeparator">
+                            <property name="orientation">horizontal</property>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property><property name="padding">4</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="credits_license">
+                            <property name="xalign">0</property>
+                            <property name="wrap">True</property>
+                            <style><class name="about-content"/></style>
+                          </object>
+                          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                  <packing><property name="expand">True</property><property name="fill">True</property></packing>
+                </child>
+              </object>
+              <packing><property name="expand">False</property><property name="fill">False</property></packing>
+            </child>
+            <child>
+              <object class="GtkFrame">
+                <style><class name="card"/></style>
+                <child>
+                  <object class="GtkBox">
+                    <property name="orientation">vertical</property>
+                    <property name="margin-start">12</property>
+                    <property name="margin-end">12</property>
+                    <property name="margin-top">8</property>
+                    <property name="margin-bottom">8</property>
+                    <child>
+                      <object class="GtkLabel" id="support_title">
+                        <property name="halign">start</property>
+                      </object>
+                      <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                    </child>
+                    <child>
+                      <object class="GtkBox">
+                        <property name="height-request">4</property>
+                      </object>
+                      <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                    </child>
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">horizontal</property>
+                        <property name="spacing">8</property>
+                        <property name="homogeneous">True</property>
+                        <child>
+                          <object class="GtkButton" id="github_button">
+                            <signal name="clicked" handler="_on_github_clicked"/>
+                          </object>
+                          <packing><property name="expand">True</property><property name="fill">True</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkButton" id="issues_button">
+                            <signal name="clicked" handler="_on_issues_clicked"/>
+                          </object>
+                          <packing><property name="expand">True</property><property name="fill">True</property></packing>
+                        </child>
+                        <child>
+                          <object class="GtkButton" id="docs_button">
+                            <signal name="clicked" handler="_on_docs_clicked"/>
+                          </object>
+                          <packing><property name="expand">True</property><property name="fill">True</property></packing>
+                        </child>
+                      </object>
+                      <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                    </child>
+                  </object>
+                </child>
+              </object>
+              <packing><property name="expand">False</property><property name="fill">False</property></packing>
+            </child>
+          </object>
+        </child>
+      </object>
+      <packing><property name="expand">True</property><property name="fill">True</property></packing>
+    </child>
+  </object>
+</interface>
+"""
+
+# Bold for the whole label, shared by the section titles instead of <b> markup
+TITLE_ATTRS = Pango.AttrList()
+TITLE_ATTRS.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+
+# Builder object ids and the translation keys of their texts
+ABOUT_TITLES = [
+    ('info_title', 'settings-about-info-title'),
+    ('credits_title', 'settings-about-credits-title'),
+    ('support_title', 'settings-about-support-title'),
+]
+ABOUT_MARKUP = [
+    ('info_description', 'settings-about-description'),
+    ('info_version', 'settings-about-version'),
+    ('info_author', 'settings-about-author'),
+    ('credits_sponsor', 'settings-about-sponsor'),
+    ('credits_license', 'settings-about-license'),
+]
+ABOUT_BUTTONS = [
+    ('github_button', 'settings-about-github-btn', 'settings-about-github-tooltip'),
+    ('issues_button', 'settings-about-issues-btn', 'settings-about-issues-tooltip'),
+    ('docs_button', 'settings-about-docs-btn', 'settings-about-docs-tooltip'),
+]
+
+
 class AboutTab:
     """Creates the About tab with extension information and links."""
 
@@ -21,195 +237,24 @@ class AboutTab:
 
     def create(self):
         """Create the About tab widget."""
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        main_box.set_margin_start(16)
-        main_box.set_margin_end(16)
-        main_box.set_margin_top(16)
-        main_box.set_margin_bottom(16)
-
-        # Apply CSS for smaller font size (except titles)
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            .about-content label {
-                font-size: 0.9em;
-            }
-        """)
-        style_context = main_box.get_style_context()
-        style_context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-
-        # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        main_box.pack_start(scrolled, True, True, 0)
-
-        # Container for all sections
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        scrolled.add(content_box)
-
-        # Top row: Info and Credits side by side
-        top_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
-        content_box.pack_start(top_row, False, False, 0)
-
-        # Section 1: Extension Information (left)
-        info_section = self._create_info_section()
-        top_row.pack_start(info_section, True, True, 0)
-
-        # Section 2: Credits & Sponsors (right)
-        credits_section = self._create_credits_section()
-        top_row.pack_start(credits_section, True, True, 0)
-
-        # Section 3: Help & Support (bottom, full width)
-        support_section = self._create_support_section()
-        content_box.pack_start(support_section, False, False, 0)
+        self.builder = Gtk.Builder.new_from_string(ABOUT_UI_XML, -1)
+        self.builder.connect_signals(self)
+        main_box = self.builder.get_object('main_box')
+
+        # Fill in translated texts
+        for obj_id, key in ABOUT_TITLES:
+            title = self.builder.get_object(obj_id)
+            title.set_text(_(key))
+            title.set_attributes(TITLE_ATTRS)
+        for obj_id, key in ABOUT_MARKUP:
+            self.builder.get_object(obj_id).set_markup(_(key))
+        for obj_id, label_key, tooltip_key in ABOUT_BUTTONS:
+            button = self.builder.get_object(obj_id)
+            button.set_label(_(label_key))
+            button.set_tooltip_text(_(tooltip_key))
 
         return main_box
 
-    def _create_info_section(self):
-        """Create the Extension Information section."""
-        card = Gtk.Frame()
-        card.get_style_context().add_class('card')
-
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        vbox.set_margin_start(12)
-        vbox.set_margin_end(12)
-        vbox.set_margin_top(8)
-        vbox.set_margin_bottom(8)
-        card.add(vbox)
-
-        # Section title
-        title = Gtk.Label()
-        title.set_markup(f"<b>{_('settings-about-info-title')}</b>")
-        title.set_halign(Gtk.Align.START)
-        vbox.pack_start(title, False, False, 0)
-
-        # Description
-        desc_label = Gtk.Label()
-        desc_label.set_markup(_('settings-about-description'))
-        desc_label.set_xalign(0.0)  # Left align text
-        desc_label.set_line_wrap(True)
-        desc_label.get_style_context().add_class('about-content')
-        vbox.pack_start(desc_label, False, False, 0)
-
-        # Separator
-        separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        vbox.pack_start(separator, False, False, 4)
-
-        # Version info
-        version_label = Gtk.Label()
-        version_label.set_markup(_('settings-about-version'))
-        version_label.set_xalign(0.0)  # Left align text
-        version_label.set_line_wrap(True)
-        version_label.set_selectable(True)
-        version_label.get_style_context().add_class('about-content')
-        vbox.pack_start(version_label, False, False, 0)
-
-        # Separator
-        separator2 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        vbox.pack_start(separator2, False, False, 6)
-
-        # Author info
-        author_label = Gtk.Label()
-        author_label.set_markup(_('settings-about-author'))
-        author_label.set_xalign(0.0)  # Left align text
-        author_label.set_line_wrap(True)
-        author_label.set_selectable(True)
-        author_label.get_style_context().add_class('about-content')
-        vbox.pack_start(author_label, False, False, 0)
-
-        return card
-
-    def _create_support_section(self):
-        """Create the Help & Support section."""
-        card = Gtk.Frame()
-        card.get_style_context().add_class('card')
-
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        vbox.set_margin_start(12)
-        vbox.set_margin_end(12)
-        vbox.set_margin_top(8)
-        vbox.set_margin_bottom(8)
-        card.add(vbox)
-
-        # Section title
-        title = Gtk.Label()
-        title.set_markup(f"<b>{_('settings-about-support-title')}</b>")
-        title.set_halign(Gtk.Align.START)
-        vbox.pack_start(title, False, False, 0)
-
-        # Spacer - smaller gap before buttons
-        spacer = Gtk.Box()
-        spacer.set_size_request(-1, 4)  # Small 4px gap instead of 12px
-        vbox.pack_start(spacer, False, False, 0)
-
-        # Button box - horizontal layout
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        button_box.set_homogeneous(True)
-        vbox.pack_start(button_box, False, False, 0)
-
-        # GitHub button
-        github_btn = Gtk.Button(label=_('settings-about-github-btn'))
-        github_btn.set_tooltip_text(_('settings-about-github-tooltip'))
-        github_btn.connect('clicked', self._on_github_clicked)
-        button_box.pack_start(github_btn, True, True, 0)
-
-        # Issues button
-        issues_btn = Gtk.Button(label=_('settings-about-issues-btn'))
-        issues_btn.set_tooltip_text(_('settings-about-issues-tooltip'))
-        issues_btn.connect('clicked', self._on_issues_clicked)
-        button_box.pack_start(issues_btn, True, True, 0)
-
-        # Documentation button
-        docs_btn = Gtk.Button(label=_('settings-about-docs-btn'))
-        docs_btn.set_tooltip_text(_('settings-about-docs-tooltip'))
-        docs_btn.connect('clicked', self._on_docs_clicked)
-        button_box.pack_start(docs_btn, True, True, 0)
-
-        return card
-
-    def _create_credits_section(self):
-        """Create the Credits & Sponsors section."""
-        card = Gtk.Frame()
-        card.get_style_context().add_class('card')
-
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        vbox.set_margin_start(12)
-        vbox.set_margin_end(12)
-        vbox.set_margin_top(8)
-        vbox.set_margin_bottom(8)
-        card.add(vbox)
-
-        # Section title
-        title = Gtk.Label()
-        title.set_markup(f"<b>{_('settings-about-credits-title')}</b>")
-        title.set_halign(Gtk.Align.START)
-        vbox.pack_start(title, False, False, 0)
-
-        # Sponsor info
-        sponsor_label = Gtk.Label()
-        sponsor_label.set_markup(_('settings-about-sponsor'))
-        sponsor_label.set_xalign(0.0)  # Left align text
-        sponsor_label.set_line_wrap(True)
-        sponsor_label.set_use_markup(True)
-        sponsor_label.get_style_context().add_class('about-content')
-        vbox.pack_start(sponsor_label, False, False, 0)
-
-        # Make links clickable
-        sponsor_label.connect('activate-link', self._on_link_clicked)
-
-        # Separator
-        separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        vbox.pack_start(separator, False, False, 4)
-
-        # License info
-        license_label = Gtk.Label()
-        license_label.set_markup(_('settings-about-license'))
-        license_label.set_xalign(0.0)  # Left align text
-        license_label.set_line_wrap(True)
-        license_label.get_style_context().add_class('about-content')
-        vbox.pack_start(license_label, False, False, 0)
-
-        return card
-
     def _on_github_clicked(self, widget):
         """Handle GitHub button click."""
         url = "https://github.com/carsteneu/remember"
@@ -233,6 +278,7 @@ class AboutTab:
     def _open_url(self, url):
         """Open URL in default browser."""
         try:
-            subprocess.Popen(['xdg-open', url])
-        except Exception as e:
+            # GTK launches the handler itself (or via the portal), no child to reap
+            Gtk.show_uri_on_window(self.parent, url, Gdk.CURRENT_TIME)
+        except GLib.Error as e:
             print(f"Error opening URL {url}: {e}", file=sys.stderr)
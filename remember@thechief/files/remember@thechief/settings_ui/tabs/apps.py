@@ -9,13 +9,18 @@ Dynamically loads plugin configurations and provides UI for:
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, Pango
+from gi.repository import Gtk, Gio, GLib, Pango
+import copy
+import hashlib
 import json
 import os
+from dataclasses import dataclass
+from typing import Tuple
 
-from ..plugin_loader import PluginLoader
+from ..plugin_loader import get_shared_loader
 from ..plugin_handlers import HandlerFactory
-from ..utils import show_message
+from ..idle_queue import IdleQueue
+from ..utils import show_message, atomic_write
 from ..i18n import _
 
 
@@ -24,6 +29,87 @@ EXTENSION_SETTINGS_FILE = os.path.join(
     GLib.get_home_dir(), '.config', 'remember@thechief', 'extension-settings.json'
 )
 
+# Last parsed extension settings as ((mtime_ns, size), data)
+_extension_settings_cache = None
+
+@dataclass(frozen=True)
+class PluginCardModel:
+    """Display strings of a plugin card, prepared once per loaded plugin."""
+    name_markup: str
+    type_value: str
+    launch_flags: Tuple[str, ...]               # extension setting keys with a switch
+    features: Tuple[Tuple[str, str], ...]       # static key: value rows
+    checks: Tuple[Tuple[str, dict], ...]        # (label, check config) per app setting
+
+
+# Card models by plugin name, as (plugin, model); the shared loader keeps
+# unchanged plugin objects across reloads, so identity tells if it's stale
+_card_models = {}
+
+
+def get_card_model(plugin):
+    """Get the card model for a plugin, building it on first use."""
+    cached = _card_models.get(plugin.name)
+    if cached is not None and cached[0] is plugin:
+        return cached[1]
+
+    features = []
+    if plugin.is_single_instance:
+        features.append(('singleInstance', 'true'))
+    if plugin.auto_restore:
+        features.append(('autoRestore', 'true'))
+
+    model = PluginCardModel(
+        name_markup=f"<b>{GLib.markup_escape_text(plugin.display_name)}</b>",
+        type_value=plugin.plugin_type or '-',
+        launch_flags=plugin.launch_flag_keys,
+        features=tuple(features),
+        checks=tuple(
+            (setting.label, setting.check)
+            for setting in plugin.settings.values()
+            if setting.type == 'app_config' and setting.check
+        ),
+    )
+    _card_models[plugin.name] = (plugin, model)
+    return model
+
+
+# Delay for writing settings after a toggle, so a burst of toggles is saved once
+SETTINGS_FLUSH_DELAY_MS = 250
+
+
+def _compile_setter(root, keys):
+    """Create a function storing a value at a key path in root.
+
+    Missing intermediate dicts are created when the setter is called.
+    """
+    *parents, last = keys
+
+    def setter(value):
+        current = root
+        for k in parents:
+            current = current.setdefault(k, {})
+        current[last] = value
+
+    return setter
+
+
+def _config_digest(config_data):
+    """Hash a config's canonical JSON form, to tell if it was edited."""
+    canonical = json.dumps(config_data, sort_keys=True).encode()
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _extract_value(value_type, widget):
+    """Read an edited value from its widget."""
+    if value_type == 'bool':
+        return widget.get_active()
+    if value_type == 'list':
+        return [v.strip() for v in widget.get_text().split(',') if v.strip()]
+    if value_type == 'number':
+        return int(widget.get_value())
+    return widget.get_text()
+
 
 class PluginEditDialog(Gtk.Dialog):
     """Dialog for editing plugin configuration."""
@@ -38,12 +124,18 @@ class PluginEditDialog(Gtk.Dialog):
         self.plugin = plugin
         self.plugin_loader = plugin_loader
         self.config_path = os.path.join(plugin.plugin_path, 'config.json')
-        self.config_data = self._load_config()
+        self.config_data = {}
+        # Digest of config_data as loaded; saving an unedited config is a no-op
+        self._loaded_digest = None
         self.entries = {}
+        # (setter, value_type, widget) per editable field
+        self._compiled = []
 
         self.set_default_size(700, 600)
         self.add_button(_("Cancel"), Gtk.ResponseType.CANCEL)
         self.add_button(_("Save"), Gtk.ResponseType.OK)
+        # Nothing to save until the config is loaded
+        self.set_response_sensitive(Gtk.ResponseType.OK, False)
 
         content = self.get_content_area()
         content.set_margin_start(16)
@@ -59,37 +151,62 @@ class PluginEditDialog(Gtk.Dialog):
         content.pack_start(scrolled, True, True, 0)
 
         # Settings container
-        settings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        scrolled.add(settings_box)
+        self.settings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        scrolled.add(self.settings_box)
 
-        # Add editable fields for key config values
-        self._add_basic_fields(settings_box)
-        self._add_launch_fields(settings_box)
-        self._add_features_fields(settings_box)
+        self._loading_label = Gtk.Label(label=_("Loading..."))
+        self._loading_label.get_style_context().add_class("dim-label")
+        self.settings_box.pack_start(self._loading_label, True, True, 0)
 
         self.show_all()
+        self._load_config()
 
     def _load_config(self):
-        """Load the plugin's config.json."""
+        """Start reading the plugin's config.json without blocking the UI."""
+        self._load_cancellable = Gio.Cancellable()
+        self.connect("destroy", lambda w: self._load_cancellable.cancel())
+        Gio.File.new_for_path(self.config_path).load_contents_async(
+            self._load_cancellable, self._on_config_loaded
+        )
+
+    def _on_config_loaded(self, source, result):
+        """Parse the loaded config.json and add the editable fields."""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
+            _ok, data, _etag = source.load_contents_finish(result)
+            self.config_data = json.loads(data)
+        except GLib.Error as e:
+            if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                return
+            print(f"Error loading config: {e.message}")
+        except ValueError as e:
             print(f"Error loading config: {e}")
-            return {}
+
+        self._loaded_digest = _config_digest(self.config_data)
+        self._loading_label.destroy()
+
+        # Add editable fields for key config values
+        self._add_basic_fields(self.settings_box)
+        self._add_launch_fields(self.settings_box)
+        self._add_features_fields(self.settings_box)
+
+        self.settings_box.show_all()
+        self.set_response_sensitive(Gtk.ResponseType.OK, True)
 
     def _save_config(self):
         """Save the plugin's config.json."""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config_data, f, indent=2)
+            # Serialize in one go; the extension may read the file at any time
+            atomic_write(self.config_path, json.dumps(self.config_data, indent=2))
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
 
     def _add_section_header(self, box, title):
-        """Add a section header."""
+        """Add a section header.
+
+        Returns the grid the section's fields are added to.
+        """
         label = Gtk.Label()
         label.set_markup(f"<b>{title}</b>")
         label.set_halign(Gtk.Align.START)
@@ -99,12 +216,18 @@ class PluginEditDialog(Gtk.Dialog):
         sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         box.pack_start(sep, False, False, 0)
 
-    def _add_field(self, box, key, value, editable=True, tooltip=None, display_name=None):
-        """Add a key:value field."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        row.set_margin_start(8)
-        box.pack_start(row, False, False, 0)
+        grid = Gtk.Grid(column_spacing=8, row_spacing=8)
+        grid.set_margin_start(8)
+        box.pack_start(grid, False, False, 0)
+        return grid
+
+    def _add_field(self, grid, key, value, editable=True, tooltip=None, display_name=None,
+                   key_path=None):
+        """Add a key:value field as a new row of a section grid.
 
+        key_path gives the keys leading to the value when key itself
+        contains dots that are not path separators.
+        """
         # Key label with display name
         label_text = display_name if display_name else key
         key_label = Gtk.Label(label=f"{label_text}:")
@@ -112,7 +235,7 @@ class PluginEditDialog(Gtk.Dialog):
         key_label.set_width_chars(25)
         key_label.set_xalign(0)
         key_label.get_style_context().add_class('dim-label')
-        row.pack_start(key_label, False, False, 0)
+        grid.attach_next_to(key_label, None, Gtk.PositionType.BOTTOM, 1, 1)
 
         # Value entry or label
         if editable:
@@ -137,25 +260,30 @@ class PluginEditDialog(Gtk.Dialog):
                 entry.set_text(str(value) if value else '')
                 entry.set_hexpand(True)
                 self.entries[key] = ('string', entry)
-            row.pack_start(entry, True, True, 0)
+            value_widget = entry
+            self._compiled.append(
+                (_compile_setter(self.config_data, key_path or key.split('.')),) + self.entries[key])
         else:
             value_label = Gtk.Label(label=str(value) if value else '-')
             value_label.set_halign(Gtk.Align.START)
             value_label.set_ellipsize(Pango.EllipsizeMode.END)
-            row.pack_start(value_label, True, True, 0)
+            value_label.set_hexpand(True)
+            value_widget = value_label
+        grid.attach_next_to(value_widget, key_label, Gtk.PositionType.RIGHT, 1, 1)
 
         if tooltip:
-            row.set_tooltip_text(tooltip)
+            key_label.set_tooltip_text(tooltip)
+            value_widget.set_tooltip_text(tooltip)
 
     def _add_basic_fields(self, box):
         """Add basic plugin info fields."""
-        self._add_section_header(box, _("Allgemeine Informationen"))
+        grid = self._add_section_header(box, _("Allgemeine Informationen"))
 
-        self._add_field(box, 'displayName', self.config_data.get('displayName', ''),
+        self._add_field(grid, 'displayName', self.config_data.get('displayName', ''),
                        display_name=_("Anzeigename"))
-        self._add_field(box, 'description', self.config_data.get('description', ''),
+        self._add_field(grid, 'description', self.config_data.get('description', ''),
                        display_name=_("Beschreibung"))
-        self._add_field(box, 'wmClass', self.config_data.get('wmClass', []),
+        self._add_field(grid, 'wmClass', self.config_data.get('wmClass', []),
                        display_name=_("Fensterklassen"),
                        tooltip=_("Fensterklassen-Namen (komma-getrennt)"))
 
@@ -165,12 +293,12 @@ class PluginEditDialog(Gtk.Dialog):
         if not launch:
             return
 
-        self._add_section_header(box, _("Start-Konfiguration"))
+        grid = self._add_section_header(box, _("Start-Konfiguration"))
 
-        self._add_field(box, 'launch.executables', launch.get('executables', []),
+        self._add_field(grid, 'launch.executables', launch.get('executables', []),
                        display_name=_("Ausführbare Dateien"),
                        tooltip=_("Programmpfade (komma-getrennt)"))
-        self._add_field(box, 'launch.flags', launch.get('flags', []),
+        self._add_field(grid, 'launch.flags', launch.get('flags', []),
                        display_name=_("Standard-Flags"),
                        tooltip=_("Standard Kommandozeilen-Flags (komma-getrennt)"))
 
@@ -179,9 +307,10 @@ class PluginEditDialog(Gtk.Dialog):
         for flag_key, flags in cond_flags.items():
             # Generate readable name
             readable_name = flag_key.replace('launchFlags.', '').replace('SessionRestore', ' Session Restore')
-            self._add_field(box, f'launch.conditionalFlags.{flag_key}', flags,
+            self._add_field(grid, f'launch.conditionalFlags.{flag_key}', flags,
                            display_name=readable_name,
-                           tooltip=_("Bedingte Flags wenn aktiviert"))
+                           tooltip=_("Bedingte Flags wenn aktiviert"),
+                           key_path=('launch', 'conditionalFlags', flag_key))
 
     def _add_features_fields(self, box):
         """Add features fields."""
@@ -189,79 +318,119 @@ class PluginEditDialog(Gtk.Dialog):
         if not features:
             return
 
-        self._add_section_header(box, _("Funktionen"))
+        grid = self._add_section_header(box, _("Funktionen"))
 
         if 'isSingleInstance' in features:
-            self._add_field(box, 'features.isSingleInstance', features.get('isSingleInstance', False),
+            self._add_field(grid, 'features.isSingleInstance', features.get('isSingleInstance', False),
                            display_name=_("Einzelinstanz"))
         if 'autoRestore' in features:
-            self._add_field(box, 'features.autoRestore', features.get('autoRestore', False),
+            self._add_field(grid, 'features.autoRestore', features.get('autoRestore', False),
                            display_name=_("Automatische Wiederherstellung"))
         if 'timeout' in features:
-            self._add_field(box, 'features.timeout', features.get('timeout', 60000),
+            self._add_field(grid, 'features.timeout', features.get('timeout', 60000),
                            display_name=_("Timeout (ms)"),
                            tooltip=_("Wartezeit in Millisekunden"))
         if 'gracePeriod' in features:
-            self._add_field(box, 'features.gracePeriod', features.get('gracePeriod', 30000),
+            self._add_field(grid, 'features.gracePeriod', features.get('gracePeriod', 30000),
                            display_name=_("Kulanzzeit (ms)"),
                            tooltip=_("Zusätzliche Wartezeit in Millisekunden"))
 
     def get_updated_config(self):
         """Get the updated configuration from entries."""
-        for key, (value_type, widget) in self.entries.items():
-            # Parse the key path
-            parts = key.split('.')
-
-            # Get the value from widget
-            if value_type == 'bool':
-                value = widget.get_active()
-            elif value_type == 'list':
-                text = widget.get_text()
-                value = [v.strip() for v in text.split(',') if v.strip()]
-            elif value_type == 'number':
-                value = int(widget.get_value())
-            else:
-                value = widget.get_text()
-
-            # Set the value in config_data
-            if len(parts) == 1:
-                self.config_data[key] = value
-            elif len(parts) == 2:
-                if parts[0] not in self.config_data:
-                    self.config_data[parts[0]] = {}
-                self.config_data[parts[0]][parts[1]] = value
-            elif len(parts) == 3:
-                if parts[0] not in self.config_data:
-                    self.config_data[parts[0]] = {}
-                if parts[1] not in self.config_data[parts[0]]:
-                    self.config_data[parts[0]][parts[1]] = {}
-                self.config_data[parts[0]][parts[1]][parts[2]] = value
+        for setter, value_type, widget in self._compiled:
+            setter(_extract_value(value_type, widget))
 
         return self.config_data
 
     def save(self):
         """Save the updated configuration."""
         self.get_updated_config()
+        if _config_digest(self.config_data) == self._loaded_digest:
+            return True
         return self._save_config()
 
 
+class PluginCard(Gtk.Frame):
+    """Compact plugin card: a header with name and edit button over a details grid.
+
+    Cards outlive the tab that shows them; a rebuilt tab takes them from
+    the pool and calls update() instead of creating new widgets.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.plugin = None
+        self.get_style_context().add_class('plugin-card')
+
+        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        main_box.set_margin_start(12)
+        main_box.set_margin_end(12)
+        main_box.set_margin_top(10)
+        main_box.set_margin_bottom(10)
+        self.add(main_box)
+
+        # Header row with name and edit button
+        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        main_box.pack_start(header_box, False, False, 0)
+
+        # Plugin name
+        self.name_label = Gtk.Label()
+        self.name_label.set_halign(Gtk.Align.START)
+        header_box.pack_start(self.name_label, True, True, 0)
+
+        # Edit button
+        self.edit_button = Gtk.Button()
+        self.edit_button.set_image(
+            Gtk.Image.new_from_icon_name("document-edit-symbolic", Gtk.IconSize.BUTTON))
+        self.edit_button.set_tooltip_text(_("Edit Settings"))
+        self.edit_button.get_style_context().add_class('flat')
+        header_box.pack_end(self.edit_button, False, False, 0)
+
+        # Key:Value list, one grid row per entry
+        self.details = Gtk.Grid(column_spacing=4, row_spacing=2)
+        self.details.set_margin_top(6)
+        main_box.pack_start(self.details, False, False, 0)
+
+    def update(self, plugin):
+        """Show a plugin's header; the details grid starts out empty."""
+        self.plugin = plugin
+        self.name_label.set_markup(get_card_model(plugin).name_markup)
+
+    def clear(self):
+        """Remove the details rows, ready for the pool."""
+        for child in self.details.get_children():
+            child.destroy()
+        self.plugin = None
+
+
+# Plugin cards of torn down Apps tabs, reused by the next one
+_card_pool = []
+
+
 class AppsSessionTab:
     """Creates the Apps & Session configuration tab with dynamic plugin loading."""
 
     def __init__(self, data_manager, parent_window):
         self.data_manager = data_manager
         self.parent = parent_window
-        self.plugin_loader = PluginLoader()
+        self.plugin_loader = get_shared_loader()
         self.extension_settings = self._load_extension_settings()
+        self._settings_dirty = False
+        self._flush_source = 0
 
     def _load_extension_settings(self):
-        """Load extension settings from JSON file."""
-        if os.path.exists(EXTENSION_SETTINGS_FILE):
-            try:
-                with open(EXTENSION_SETTINGS_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        """Load extension settings from JSON file (parsed once per file version)."""
+        global _extension_settings_cache
+        try:
+            st = os.stat(EXTENSION_SETTINGS_FILE)
+            signature = (st.st_mtime_ns, st.st_size)
+            if _extension_settings_cache is None or _extension_settings_cache[0] != signature:
+                with open(EXTENSION_SETTINGS_FILE, 'rb') as f:
+                    _extension_settings_cache = (signature, json.loads(f.read()))
+            # The tab modifies its settings in place
+            return copy.deepcopy(_extension_settings_cache[1])
+        except Exception:
+            pass
         return {
             "launchFlags": {
                 "browserSessionRestore": True,
@@ -275,11 +444,26 @@ class AppsSessionTab:
         """Save extension settings to JSON file."""
         try:
             os.makedirs(os.path.dirname(EXTENSION_SETTINGS_FILE), exist_ok=True)
-            with open(EXTENSION_SETTINGS_FILE, 'w') as f:
-                json.dump(self.extension_settings, f, indent=2)
+            atomic_write(EXTENSION_SETTINGS_FILE, json.dumps(self.extension_settings, indent=2))
         except Exception as e:
             print(f"Error saving extension settings: {e}")
 
+    def _schedule_settings_flush(self):
+        """Mark settings as changed and save them shortly after."""
+        self._settings_dirty = True
+        if self._flush_source == 0:
+            self._flush_source = GLib.timeout_add(SETTINGS_FLUSH_DELAY_MS, self._flush_extension_settings)
+
+    def _flush_extension_settings(self, *args):
+        """Save pending settings changes (timeout callback and on teardown)."""
+        if self._flush_source:
+            GLib.source_remove(self._flush_source)
+            self._flush_source = 0
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self._save_extension_settings()
+        return False
+
     def create(self):
         """Create the Apps & Session tab widget."""
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -287,6 +471,8 @@ class AppsSessionTab:
         main_box.set_margin_end(16)
         main_box.set_margin_top(16)
         main_box.set_margin_bottom(16)
+        # Don't lose a pending save when the window closes or the tab is rebuilt
+        main_box.connect("destroy", self._flush_extension_settings)
 
         # Header
         header = Gtk.Label()
@@ -301,142 +487,215 @@ class AppsSessionTab:
         main_box.pack_start(desc, False, False, 0)
 
         # Scrolled window for content
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        main_box.pack_start(scrolled, True, True, 0)
-
-        # 2-column grid for plugins
-        self.grid = Gtk.Grid()
-        self.grid.set_column_spacing(16)
-        self.grid.set_row_spacing(12)
-        self.grid.set_column_homogeneous(True)
-        scrolled.add(self.grid)
+        self.scrolled = Gtk.ScrolledWindow()
+        self.scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        main_box.pack_start(self.scrolled, True, True, 0)
+
+        # 2-column layout for plugin cards
+        self.flowbox = Gtk.FlowBox()
+        self.flowbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.flowbox.set_min_children_per_line(2)
+        self.flowbox.set_max_children_per_line(2)
+        self.flowbox.set_homogeneous(True)
+        self.flowbox.set_column_spacing(16)
+        self.flowbox.set_row_spacing(12)
+        self.flowbox.set_valign(Gtk.Align.START)
+        self.scrolled.add(self.flowbox)
 
         # Load and display plugins in 2 columns
         plugins = self.plugin_loader.get_sorted_plugins()
 
-        for i, plugin in enumerate(plugins):
-            card = self._create_plugin_card(plugin)
-            col = i % 2
-            row = i // 2
-            self.grid.attach(card, col, row, 1, 1)
+        # Check rows waiting for their result: handler -> spinner
+        self._pending_checks = {}
+
+        # Cards start as a header only; their details (and checks) are
+        # filled in once they scroll into view: (flowbox child, details grid, plugin)
+        self._unpopulated_cards = []
+        self._visibility_source = 0
+
+        # Handlers referring back to this tab, as (widget, handler id);
+        # disconnected on teardown so no closure keeps the old tab alive
+        self._signal_ids = []
+        adjustment = self.scrolled.get_vadjustment()
+        self._signal_ids.append((adjustment, adjustment.connect(
+            "value-changed", self._on_cards_moved)))
+        self._signal_ids.append((self.flowbox, self.flowbox.connect(
+            "size-allocate", self._on_cards_moved)))
+        self.flowbox.connect("destroy", self._on_cards_destroyed)
+
+        # Build the cards a few at a time so the window can draw meanwhile
+        self._card_queue = IdleQueue(budget_ms=6)
+        for plugin in plugins:
+            self._card_queue.push(lambda p=plugin: self._add_plugin_card(p))
 
         return main_box
 
-    def _create_plugin_card(self, plugin):
-        """Create a compact card for a plugin with key:value list."""
-        frame = Gtk.Frame()
-        frame.get_style_context().add_class('plugin-card')
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        main_box.set_margin_start(12)
-        main_box.set_margin_end(12)
-        main_box.set_margin_top(10)
-        main_box.set_margin_bottom(10)
-        frame.add(main_box)
-
-        # Header row with name and edit button
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        main_box.pack_start(header_box, False, False, 0)
-
-        # Plugin name
-        name_label = Gtk.Label()
-        name_label.set_markup(f"<b>{plugin.display_name}</b>")
-        name_label.set_halign(Gtk.Align.START)
-        header_box.pack_start(name_label, True, True, 0)
+    def _on_cards_destroyed(self, widget):
+        """Stop pending card work when the tab is torn down."""
+        for obj, handler_id in self._signal_ids:
+            obj.disconnect(handler_id)
+        self._signal_ids = []
+        self._card_queue.clear()
+        self._unpopulated_cards = []
+        self._pending_checks = {}
+        if self._visibility_source:
+            GLib.source_remove(self._visibility_source)
+            self._visibility_source = 0
+
+        # Take the cards out before the flow box destroys them
+        for child in widget.get_children():
+            card = child.get_child()
+            child.remove(card)
+            card.clear()
+            _card_pool.append(card)
+
+    def _add_plugin_card(self, plugin):
+        """Add a plugin card stub to the flow box, reusing a pooled card if any."""
+        card = _card_pool.pop() if _card_pool else PluginCard()
+        card.update(plugin)
+        self._signal_ids.append((card.edit_button, card.edit_button.connect(
+            "clicked", self._on_edit_clicked, plugin)))
+        self.flowbox.add(card)
+        card.show_all()
+        self._unpopulated_cards.append((card.get_parent(), card.details, plugin))
+        self._queue_visibility_check()
+
+    def _on_cards_moved(self, *args):
+        """Check for newly visible cards after scrolling or a resize."""
+        self._queue_visibility_check()
+
+    def _queue_visibility_check(self):
+        """Populate visible cards once the current layout pass is done."""
+        if self._visibility_source == 0 and self._unpopulated_cards:
+            self._visibility_source = GLib.idle_add(
+                self._populate_visible_cards, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _populate_visible_cards(self):
+        """Fill in the details of cards that are (partly) in the viewport."""
+        self._visibility_source = 0
+        adjustment = self.scrolled.get_vadjustment()
+        top = adjustment.get_value()
+        bottom = top + adjustment.get_page_size()
+
+        remaining = []
+        for child, settings_grid, plugin in self._unpopulated_cards:
+            alloc = child.get_allocation()
+            # Cards not laid out yet report a 1px allocation
+            if alloc.height > 1 and alloc.y < bottom and alloc.y + alloc.height > top:
+                self._populate_card_details(settings_grid, plugin)
+            else:
+                remaining.append((child, settings_grid, plugin))
+        self._unpopulated_cards = remaining
+        return False
 
-        # Edit button
-        edit_btn = Gtk.Button()
-        edit_btn.set_image(Gtk.Image.new_from_icon_name("document-edit-symbolic", Gtk.IconSize.BUTTON))
-        edit_btn.set_tooltip_text(_("Edit Settings"))
-        edit_btn.get_style_context().add_class('flat')
-        edit_btn.connect("clicked", self._on_edit_clicked, plugin)
-        header_box.pack_end(edit_btn, False, False, 0)
-
-        # Key:Value list
-        settings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        settings_box.set_margin_top(6)
-        main_box.pack_start(settings_box, False, False, 0)
+    def _populate_card_details(self, settings_grid, plugin):
+        """Add a card's key:value rows and start its checks."""
+        model = get_card_model(plugin)
 
         # Show key settings as key: value
-        self._add_kv_row(settings_box, 'type', plugin.plugin_type or '-')
+        self._add_kv_row(settings_grid, 'type', model.type_value)
 
         # Show launch flags status
         launch_flags = self.extension_settings.get('launchFlags', {})
-        for flag_key in plugin.conditional_flags:
-            if flag_key.startswith('launchFlags.'):
-                setting_key = flag_key.replace('launchFlags.', '')
-                is_enabled = launch_flags.get(setting_key, True)
-                row = self._add_kv_row_with_switch(settings_box, setting_key, is_enabled)
+        for setting_key in model.launch_flags:
+            self._add_kv_row_with_switch(settings_grid, setting_key, launch_flags.get(setting_key, True))
 
         # Show features
-        if plugin.is_single_instance:
-            self._add_kv_row(settings_box, 'singleInstance', 'true')
-        if plugin.auto_restore:
-            self._add_kv_row(settings_box, 'autoRestore', 'true')
+        for key, value in model.features:
+            self._add_kv_row(settings_grid, key, value)
 
         # Show app config settings status
-        for key, setting in plugin.settings.items():
-            if setting.type == 'app_config' and setting.check:
-                handler = HandlerFactory.create_check_handler(setting.check, self.parent)
-                if handler:
-                    try:
-                        is_configured, _err = handler.execute()
-                        status = '✓' if is_configured else '✗'
-                        self._add_kv_row(settings_box, setting.label, status)
-                    except Exception:
-                        self._add_kv_row(settings_box, setting.label, '?')
-
-        return frame
-
-    def _add_kv_row(self, box, key, value):
-        """Add a simple key: value row."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        box.pack_start(row, False, False, 0)
+        new_checks = []
+        for label, check in model.checks:
+            handler = HandlerFactory.create_check_handler(check, self.parent)
+            if handler:
+                self._pending_checks[handler] = self._add_kv_row_pending(settings_grid, label)
+                new_checks.append(handler)
+
+        settings_grid.show_all()
+
+        # Checks may stat files or run commands - keep them off the UI thread
+        if new_checks:
+            HandlerFactory.run_checks_async(new_checks, self._on_check_done)
+
+    def _on_check_done(self, handler, is_configured, _err):
+        """Replace a check row's spinner with the check result."""
+        spinner = self._pending_checks.pop(handler, None)
+        grid = spinner.get_parent() if spinner else None
+        if grid is None:
+            # Tab was rebuilt while the check was running
+            return False
+
+        if is_configured is None:
+            status = '?'
+        else:
+            status = '✓' if is_configured else '✗'
 
+        top = grid.child_get_property(spinner, 'top-attach')
+        spinner.destroy()
+        value_label = self._create_value_label(status)
+        grid.attach(value_label, 1, top, 1, 1)
+        value_label.show()
+        return False
+
+    def _add_kv_key(self, grid, key):
+        """Add the key label of a new key: value row at the bottom of grid."""
         key_label = Gtk.Label(label=f"{key}:")
         key_label.set_halign(Gtk.Align.START)
         key_label.set_width_chars(14)
         key_label.set_xalign(0)
         key_label.get_style_context().add_class('dim-label')
-        row.pack_start(key_label, False, False, 0)
+        grid.attach_next_to(key_label, None, Gtk.PositionType.BOTTOM, 1, 1)
+        return key_label
+
+    def _add_kv_row(self, grid, key, value):
+        """Add a simple key: value row."""
+        key_label = self._add_kv_key(grid, key)
+        value_label = self._create_value_label(value)
+        grid.attach_next_to(value_label, key_label, Gtk.PositionType.RIGHT, 1, 1)
+        return value_label
+
+    def _add_kv_row_pending(self, grid, key):
+        """Add a key row with a spinner in place of a not yet known value."""
+        key_label = self._add_kv_key(grid, key)
+
+        spinner = Gtk.Spinner()
+        spinner.set_halign(Gtk.Align.START)
+        spinner.start()
+        grid.attach_next_to(spinner, key_label, Gtk.PositionType.RIGHT, 1, 1)
 
+        return spinner
+
+    def _create_value_label(self, value):
+        """Create the value label of a key: value row."""
         value_label = Gtk.Label(label=str(value))
         value_label.set_halign(Gtk.Align.START)
+        value_label.set_hexpand(True)
         value_label.set_ellipsize(Pango.EllipsizeMode.END)
-        row.pack_start(value_label, True, True, 0)
-
-        return row
+        return value_label
 
-    def _add_kv_row_with_switch(self, box, key, is_enabled):
+    def _add_kv_row_with_switch(self, grid, key, is_enabled):
         """Add a key: value row with a switch."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        box.pack_start(row, False, False, 0)
-
-        key_label = Gtk.Label(label=f"{key}:")
-        key_label.set_halign(Gtk.Align.START)
-        key_label.set_width_chars(14)
-        key_label.set_xalign(0)
-        key_label.get_style_context().add_class('dim-label')
-        row.pack_start(key_label, False, False, 0)
+        key_label = self._add_kv_key(grid, key)
 
         switch = Gtk.Switch()
         switch.set_active(is_enabled)
+        switch.set_halign(Gtk.Align.START)
         switch.set_valign(Gtk.Align.CENTER)
-        switch.connect("notify::active",
-            lambda sw, param, k=key: self._on_launch_flag_changed(sw, k))
-        row.pack_start(switch, False, False, 0)
+        self._signal_ids.append((switch, switch.connect(
+            "notify::active", self._on_launch_flag_changed, key)))
+        grid.attach_next_to(switch, key_label, Gtk.PositionType.RIGHT, 1, 1)
 
-        return row
+        return switch
 
-    def _on_launch_flag_changed(self, switch, key):
+    def _on_launch_flag_changed(self, switch, _pspec, key):
         """Handle launch flag toggle changes."""
         is_active = switch.get_active()
 
         if 'launchFlags' not in self.extension_settings:
             self.extension_settings['launchFlags'] = {}
         self.extension_settings['launchFlags'][key] = is_active
-        self._save_extension_settings()
+        self._schedule_settings_flush()
 
     def _on_edit_clicked(self, button, plugin):
         """Open the edit dialog for a plugin."""
@@ -4,9 +4,8 @@ Overview Tab - Dashboard with Statistics, Quick Actions, and System Status
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, Gio, GLib
 import os
-import shutil
 
 from ..utils import (
     DataManager, WidgetFactory, run_cinnamon_js, show_message,
@@ -15,6 +14,44 @@ from ..utils import (
 from ..i18n import _
 
 
+# Whether the applet is installed; kept current by a monitor on the applets
+# directory instead of a stat on every Overview build
+_applet_installed = None
+_applet_monitor = None
+
+
+def _on_applets_dir_changed(monitor, file, other_file, event_type):
+    """Re-check the applet after changes in the applets directory."""
+    global _applet_installed
+    _applet_installed = os.path.exists(APPLET_DIR)
+
+
+def is_applet_installed():
+    """Check if the companion applet is installed."""
+    global _applet_installed, _applet_monitor
+    if _applet_installed is not None:
+        return _applet_installed
+
+    installed = os.path.exists(APPLET_DIR)
+    try:
+        applets_dir = Gio.File.new_for_path(os.path.dirname(APPLET_DIR))
+        _applet_monitor = applets_dir.monitor_directory(Gio.FileMonitorFlags.NONE, None)
+        _applet_monitor.connect("changed", _on_applets_dir_changed)
+        _applet_installed = installed
+    except GLib.Error as e:
+        # Without a monitor, check again next time
+        print(f"Cannot monitor {applets_dir.get_path()}: {e}")
+    return installed
+
+
+def mark_applet_installed():
+    """Record an applet install before the directory monitor reports it."""
+    global _applet_installed
+    if _applet_monitor is not None:
+        # Without a monitor nothing is cached; the next check stats anyway
+        _applet_installed = True
+
+
 class OverviewTab:
     """Creates the Overview & Control dashboard tab."""
 
@@ -65,7 +102,7 @@ class OverviewTab:
         apps = self.data_manager.applications
         monitors = self.data_manager.monitors
         total_apps = len(apps)
-        total_instances = sum(len(app.get("instances", [])) for app in apps.values())
+        total_instances = self.data_manager.total_instances
         total_monitors = len(monitors)
 
         # Get monitor layout info
@@ -121,7 +158,7 @@ class OverviewTab:
         box.pack_start(ext_row, False, False, 0)
 
         # Applet status
-        applet_installed = os.path.exists(APPLET_DIR)
+        applet_installed = is_applet_installed()
         if not applet_installed:
             install_btn = Gtk.Button(label=_("Install"))
             install_btn.connect("clicked", self._on_install_applet)
@@ -146,7 +183,7 @@ class OverviewTab:
         # Monitor info
         monitors = self.data_manager.monitors
         monitor_layout = self.data_manager.data.get('monitor_layout', {})
-        active_monitors = monitor_layout.get('monitors', [])
+        active_ids = {m.get('id') for m in monitor_layout.get('monitors', [])}
 
         if monitors:
             for i, (mon_id, mon_data) in enumerate(monitors.items()):
@@ -155,7 +192,7 @@ class OverviewTab:
                 mon_box.get_style_context().add_class('quick-stat')
 
                 # Check if this monitor is currently active
-                is_active = any(m.get('id') == mon_id for m in active_monitors)
+                is_active = mon_id in active_ids
                 status_label = _("Active") if is_active else ""
 
                 mon_num = Gtk.Label(label=f"{_('Monitor')} {i + 1}")
@@ -210,12 +247,14 @@ class OverviewTab:
         dialog.destroy()
 
         if response == Gtk.ResponseType.YES:
-            self.data_manager.data["applications"] = {}
+            self.data_manager.clear_applications()
             self.data_manager.save()
             self.on_refresh()
 
     def _on_install_applet(self, widget):
         """Install the companion applet."""
+        import shutil
+
         ext_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         applet_src = os.path.join(ext_dir, 'applet')
 
@@ -230,11 +269,15 @@ class OverviewTab:
         try:
             os.makedirs(APPLET_DIR, exist_ok=True)
 
-            for item in os.listdir(applet_src):
-                src = os.path.join(applet_src, item)
-                dst = os.path.join(APPLET_DIR, item)
-                if os.path.isfile(src):
-                    shutil.copy2(src, dst)
+            # copy2() already copies in-kernel via sendfile() on Linux
+            with os.scandir(applet_src) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        shutil.copy2(entry.path, os.path.join(APPLET_DIR, entry.name))
+
+            # The directory monitor reports asynchronously; the refresh below
+            # must already see the applet
+            mark_applet_installed()
 
             show_message(
                 self.parent,
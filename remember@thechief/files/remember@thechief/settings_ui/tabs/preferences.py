@@ -9,17 +9,122 @@ from gi.repository import Gtk, GLib
 import json
 import os
 
-from ..utils import WidgetFactory
+from ..utils import WidgetFactory, atomic_write, CONFIG_DIR
 from ..i18n import _
 
 # Translation function
 
 
 # Path to preferences settings file
-PREFERENCES_FILE = os.path.join(
-    GLib.get_home_dir(), '.config', 'remember@thechief', 'preferences.json'
+PREFERENCES_FILE = os.path.join(CONFIG_DIR, 'preferences.json')
+
+# Delay for writing preferences after a toggle, so a burst of toggles is saved once
+PREFERENCES_FLUSH_DELAY_MS = 250
+
+# Status indicator style class by switch state
+STATUS_CLASSES = {True: 'status-active', False: 'status-inactive'}
+
+# Layout of one setting card; texts and state are set per card
+CARD_UI_XML = """
+<interface>
+  <object class="GtkFrame" id="card">
+    <style><class name="config-frame"/></style>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">8</property>
+        <property name="margin-start">12</property>
+        <property name="margin-end">12</property>
+        <property name="margin-top">12</property>
+        <property name="margin-bottom">12</property>
+        <child>
+          <object class="GtkBox">
+            <property name="orientation">horizontal</property>
+            <property name="spacing">8</property>
+            <child>
+              <object class="GtkLabel" id="status">
+                <property name="label">●</property>
+              </object>
+              <packing><property name="expand">False</property><property name="fill">False</property></packing>
+            </child>
+            <child>
+              <object class="GtkLabel" id="title">
+                <property name="halign">start</property>
+                <property name="wrap">True</property>
+                <attributes><attribute name="weight" value="bold"/></attributes>
+              </object>
+              <packing><property name="expand">True</property><property name="fill">True</property></packing>
+            </child>
+            <child>
+              <object class="GtkSwitch" id="switch"/>
+              <packing>
+                <property name="expand">False</property><property name="fill">False</property>
+                <property name="pack-type">end</property>
+              </packing>
+            </child>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkLabel" id="description">
+            <property name="halign">start</property>
+            <property name="wrap">True</property>
+            <style><class name="dim-label"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+# Sections of setting cards: (title, [(key, label, description, default)]).
+# Strings are msgids, translated when the cards are built.
+PREFERENCE_SECTIONS = (
+    ("Window States", (
+        ('rememberSticky', "Remember sticky (on all workspaces)",
+         "Remember sticky (on all workspaces)", True),
+        ('rememberAlwaysOnTop', "Remember always-on-top",
+         "Remember always-on-top", True),
+        ('rememberShaded', "Remember shaded (rolled up)",
+         "Remember shaded (rolled up)", False),
+        ('rememberFullscreen', "Remember fullscreen",
+         "Remember fullscreen", True),
+        ('restoreMinimized', "Restore minimized state",
+         "Restore minimized state", False),
+    )),
+    ("Tracking Behavior", (
+        ('trackDialogs', "Track dialog windows",
+         "Track dialog windows", False),
+        ('trackAllWorkspaces', "Track all workspaces",
+         "Track all workspaces", True),
+    )),
+    ("Position Behavior", (
+        ('autoRestore', "Enable auto-restore on login",
+         "Enable auto-restore on login", True),
+        ('clampToScreen', "Clamp windows to screen bounds",
+         "Clamp windows to screen bounds", True),
+        ('restoreWorkspace', "Restore workspace assignments",
+         "Restore workspace assignments", True),
+    )),
+    ("UI Settings", (
+        ('showProgressWindow', "Show progress window on restore",
+         "Show the progress window during session restore", True),
+    )),
 )
 
+# Default preferences, as written when there is no preferences file yet
+DEFAULT_PREFERENCES = {
+    key: default
+    for _title, settings in PREFERENCE_SECTIONS
+    for key, _label, _description, default in settings
+}
+
+# Preferences as last read or written here, as ((mtime_ns, size), data);
+# a rebuilt tab reuses them while the file is unchanged
+_preferences_cache = None
+
 
 class PreferencesTab:
     """Creates the Preferences tab with extension settings in card layout."""
@@ -28,8 +133,10 @@ class PreferencesTab:
         self.data_manager = data_manager
         self.parent = parent_window
         self.preferences = self._load_preferences()
+        self._preferences_dirty = False
+        self._flush_source = 0
         # Save defaults if file didn't exist
-        if not os.path.exists(PREFERENCES_FILE):
+        if self._needs_initial_save:
             self._save_preferences()
 
     def create(self):
@@ -39,6 +146,8 @@ class PreferencesTab:
         main_box.set_margin_end(16)
         main_box.set_margin_top(16)
         main_box.set_margin_bottom(16)
+        # Don't lose a pending save when the window closes or the tab is rebuilt
+        main_box.connect("destroy", self._flush_preferences)
 
         # Header
         header = Gtk.Label()
@@ -57,162 +166,117 @@ class PreferencesTab:
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         main_box.pack_start(scrolled, True, True, 0)
 
-        # Container for all sections
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        scrolled.add(content_box)
-
-        # Section 1: Window States
-        window_states_settings = [
-            ('rememberSticky', _("Remember sticky (on all workspaces)"),
-             _("Remember sticky (on all workspaces)"), True),
-            ('rememberAlwaysOnTop', _("Remember always-on-top"),
-             _("Remember always-on-top"), True),
-            ('rememberShaded', _("Remember shaded (rolled up)"),
-             _("Remember shaded (rolled up)"), False),
-            ('rememberFullscreen', _("Remember fullscreen"),
-             _("Remember fullscreen"), True),
-            ('restoreMinimized', _("Restore minimized state"),
-             _("Restore minimized state"), False),
-        ]
-        section1 = self._create_settings_section(_("Window States"), window_states_settings)
-        content_box.pack_start(section1, False, False, 0)
-
-        # Section 2: Tracking Behavior
-        tracking_settings = [
-            ('trackDialogs', _("Track dialog windows"),
-             _("Track dialog windows"), False),
-            ('trackAllWorkspaces', _("Track all workspaces"),
-             _("Track all workspaces"), True),
-        ]
-        section2 = self._create_settings_section(_("Tracking Behavior"), tracking_settings)
-        content_box.pack_start(section2, False, False, 0)
-
-        # Section 3: Restore Behavior
-        restore_settings = [
-            ('autoRestore', _("Enable auto-restore on login"),
-             _("Enable auto-restore on login"), True),
-            ('clampToScreen', _("Clamp windows to screen bounds"),
-             _("Clamp windows to screen bounds"), True),
-            ('restoreWorkspace', _("Restore workspace assignments"),
-             _("Restore workspace assignments"), True),
-        ]
-        section3 = self._create_settings_section(_("Position Behavior"), restore_settings)
-        content_box.pack_start(section3, False, False, 0)
-
-        # Section 4: UI Settings
-        ui_settings = [
-            ('showProgressWindow', _("Show progress window on restore"),
-             _("Show the progress window during session restore"), True),
-        ]
-        section4 = self._create_settings_section(_("UI Settings"), ui_settings)
-        content_box.pack_start(section4, False, False, 0)
-
-        return main_box
-
-    def _create_settings_section(self, title, settings_list):
-        """Create a section with settings cards in a 2-column grid."""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-
-        # Section header
-        header = WidgetFactory.create_section_header(title)
-        section_box.pack_start(header, False, False, 0)
-
-        # Grid for cards (2 columns)
+        # One grid for all sections: header rows span both card columns
         grid = Gtk.Grid()
         grid.set_column_spacing(16)
         grid.set_row_spacing(12)
         grid.set_column_homogeneous(True)
-        section_box.pack_start(grid, False, False, 0)
+        scrolled.add(grid)
 
-        for i, (key, label_text, description, default) in enumerate(settings_list):
-            card = self._create_settings_card(key, label_text, description, default)
-            grid.attach(card, i % 2, i // 2, 1, 1)
+        row = 0
+        for title, settings_list in PREFERENCE_SECTIONS:
+            row = self._add_settings_section(grid, row, title, settings_list)
 
-        return section_box
+        return main_box
+
+    def _add_settings_section(self, grid, row, title, settings_list):
+        """Add a section header and its settings cards (2 per row) to grid.
+
+        Returns the first grid row after the section.
+        """
+        header = WidgetFactory.create_section_header(_(title))
+        if row:
+            # Set sections apart more than the cards within one
+            header.set_margin_top(4)
+        grid.attach(header, 0, row, 2, 1)
+        row += 1
+
+        for i, (key, label_text, description, _default) in enumerate(settings_list):
+            card = self._create_settings_card(key, _(label_text), _(description))
+            grid.attach(card, i % 2, row + i // 2, 1, 1)
+
+        return row + (len(settings_list) + 1) // 2
 
     def _load_preferences(self):
-        """Load preferences from JSON file."""
-        if os.path.exists(PREFERENCES_FILE):
-            try:
-                with open(PREFERENCES_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        # Default preferences
-        return {
-            'rememberSticky': True,
-            'rememberAlwaysOnTop': True,
-            'rememberShaded': False,
-            'rememberFullscreen': True,
-            'restoreMinimized': False,
-            'trackDialogs': False,
-            'trackAllWorkspaces': True,
-            'autoRestore': True,
-            'clampToScreen': True,
-            'restoreWorkspace': True,
-            'showProgressWindow': True,
-        }
+        """Load preferences from JSON file, completed with the defaults."""
+        global _preferences_cache
+        self._needs_initial_save = False
+        try:
+            st = os.stat(PREFERENCES_FILE)
+            signature = (st.st_mtime_ns, st.st_size)
+            if _preferences_cache is None or _preferences_cache[0] != signature:
+                # One read() and a parse of the whole buffer, not json.load's
+                # incremental text reads
+                with open(PREFERENCES_FILE, 'rb') as f:
+                    _preferences_cache = (signature, json.loads(f.read()))
+            return {**DEFAULT_PREFERENCES, **_preferences_cache[1]}
+        except FileNotFoundError:
+            self._needs_initial_save = True
+        except Exception:
+            # Unreadable file; keep it, it may still be fixed by hand
+            pass
+        return dict(DEFAULT_PREFERENCES)
 
     def _save_preferences(self):
         """Save preferences to JSON file."""
+        global _preferences_cache
         try:
-            os.makedirs(os.path.dirname(PREFERENCES_FILE), exist_ok=True)
-            with open(PREFERENCES_FILE, 'w') as f:
-                json.dump(self.preferences, f, indent=2)
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+            # A crash mid-write must not leave a truncated file that falls
+            # back to defaults on the next start
+            atomic_write(PREFERENCES_FILE, json.dumps(self.preferences, indent=2))
+            st = os.stat(PREFERENCES_FILE)
+            _preferences_cache = ((st.st_mtime_ns, st.st_size), dict(self.preferences))
         except Exception as e:
             print(f"Error saving preferences: {e}")
 
-    def _create_settings_card(self, key, title, description, default_value):
+    def _schedule_preferences_flush(self):
+        """Mark preferences as changed and save them shortly after."""
+        self._preferences_dirty = True
+        if self._flush_source == 0:
+            self._flush_source = GLib.timeout_add(PREFERENCES_FLUSH_DELAY_MS, self._flush_preferences)
+
+    def _flush_preferences(self, *args):
+        """Save pending preference changes (timeout callback and on teardown)."""
+        if self._flush_source:
+            GLib.source_remove(self._flush_source)
+            self._flush_source = 0
+        if self._preferences_dirty:
+            self._preferences_dirty = False
+            self._save_preferences()
+        return False
+
+    def _create_settings_card(self, key, title, description):
         """Create a card for a single setting (like Apps & Session style)."""
-        frame = Gtk.Frame()
-        frame.get_style_context().add_class('config-frame')
+        builder = Gtk.Builder.new_from_string(CARD_UI_XML, -1)
+        is_enabled = self.preferences[key]
 
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        frame.add(box)
+        # Status indicator
+        status = builder.get_object('status')
+        status.get_style_context().add_class(STATUS_CLASSES[is_enabled])
 
-        # Header with title and switch
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        box.pack_start(header_box, False, False, 0)
+        builder.get_object('title').set_text(title)
 
-        # Status indicator
-        is_enabled = self.preferences.get(key, default_value)
-        status = Gtk.Label(label="●")
-        status.get_style_context().add_class('status-active' if is_enabled else 'status-inactive')
-        header_box.pack_start(status, False, False, 0)
-
-        title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{title}</b>")
-        title_label.set_halign(Gtk.Align.START)
-        title_label.set_line_wrap(True)
-        header_box.pack_start(title_label, True, True, 0)
-
-        # Switch
-        switch = Gtk.Switch()
+        switch = builder.get_object('switch')
         switch.set_active(is_enabled)
         switch.connect("notify::active",
             lambda sw, _, k=key, st=status: self._on_switch_toggled(sw, k, st))
-        header_box.pack_end(switch, False, False, 0)
 
         # Description (displayed directly, not as tooltip)
-        desc_label = Gtk.Label(label=description)
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.set_line_wrap(True)
-        desc_label.get_style_context().add_class('dim-label')
-        box.pack_start(desc_label, False, False, 0)
+        builder.get_object('description').set_text(description)
 
-        return frame
+        return builder.get_object('card')
 
     def _on_switch_toggled(self, switch, key, status_label):
         """Handle setting toggle changes and update status indicator."""
         is_active = switch.get_active()
+        if self.preferences[key] == is_active:
+            # Notification without a change of value, nothing to save
+            return
         self.preferences[key] = is_active
-        self._save_preferences()
+        self._schedule_preferences_flush()
 
-        # Update status indicator
-        status_label.get_style_context().remove_class('status-active')
-        status_label.get_style_context().remove_class('status-inactive')
-        status_label.get_style_context().add_class('status-active' if is_active else 'status-inactive')
+        # Update status indicator: swap the class of the other state for ours
+        context = status_label.get_style_context()
+        context.remove_class(STATUS_CLASSES[not is_active])
+        context.add_class(STATUS_CLASSES[is_active])
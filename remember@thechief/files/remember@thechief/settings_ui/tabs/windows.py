@@ -4,13 +4,188 @@ Windows Tab - Consolidated view of all tracked windows with filtering and detail
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Pango
+from gi.repository import Gtk, Gio, GLib, Pango
 
 from ..utils import DataManager, format_position, get_state_badges, get_monitor_display_name
 from ..i18n import _
-import subprocess
 import os
 import signal
+import sys
+from collections import defaultdict
+from functools import lru_cache
+
+
+# Detail pane fields in display order, 2 per row: (key, msgid)
+DETAIL_FIELDS = (
+    ('application', "APPLICATION"),
+    ('workspace', "WORKSPACE"),
+    ('title', "TITLE"),
+    ('monitor_index', "MONITOR INDEX"),
+    ('x11_window_id', "X11 WINDOW ID"),
+    ('stable_sequence', "STABLE SEQ"),
+    ('geometry', "GEOMETRY"),
+    ('geometry_percent', "GEOMETRY %"),
+)
+
+# Window states shown in the detail pane, 2 per row: (instance key, msgid)
+DETAIL_STATES = (
+    ('maximized', "Maximized"),
+    ('fullscreen', "Fullscreen"),
+    ('sticky', "Sticky"),
+    ('alwaysOnTop', "Always on Top"),
+    ('shaded', "Shaded"),
+    ('minimized', "Minimized"),
+)
+
+# Check mark and style class of a detail pane state by its value
+STATE_MARKS = {True: ('✓', 'status-active'), False: ('✗', 'status-inactive')}
+
+_DETAIL_FIELD_XML = """
+              <child>
+                <object class="GtkLabel" id="{key}_name">
+                  <property name="halign">start</property>
+                  <property name="no-show-all">{optional}</property>
+                  <style><class name="detail-label"/></style>
+                </object>
+                <packing><property name="left-attach">{col}</property><property name="top-attach">{row}</property></packing>
+              </child>
+              <child>
+                <object class="GtkLabel" id="{key}">
+                  <property name="halign">start</property>
+                  <property name="selectable">True</property>
+                  <property name="wrap">True</property>
+                  <property name="max-width-chars">18</property>
+                  <property name="ellipsize">end</property>
+                  <property name="no-show-all">{optional}</property>
+                  <style><class name="detail-value"/></style>
+                </object>
+                <packing><property name="left-attach">{col}</property><property name="top-attach">{value_row}</property></packing>
+              </child>"""
+
+_DETAIL_STATE_XML = """
+              <child>
+                <object class="GtkBox">
+                  <property name="orientation">horizontal</property>
+                  <property name="spacing">4</property>
+                  <child>
+                    <object class="GtkLabel" id="state_{key}"/>
+                    <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                  </child>
+                  <child>
+                    <object class="GtkLabel" id="state_{key}_name">
+                      <property name="halign">start</property>
+                    </object>
+                    <packing><property name="expand">False</property><property name="fill">False</property></packing>
+                  </child>
+                </object>
+                <packing><property name="left-attach">{col}</property><property name="top-attach">{row}</property></packing>
+              </child>"""
+
+# Layout of the detail pane: a placeholder page and the details page, whose
+# texts are set per selected window. Labels that are hidden for some windows
+# are kept out of show_all().
+DETAIL_UI_XML = """
+<interface>
+  <object class="GtkStack" id="detail_stack">
+    <child>
+      <object class="GtkLabel" id="placeholder">
+        <property name="halign">center</property>
+        <property name="valign">center</property>
+      </object>
+      <packing><property name="name">placeholder</property></packing>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">0</property>
+        <child>
+          <object class="GtkLabel" id="header">
+            <property name="halign">start</property>
+            <style><class name="detail-header"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkGrid">
+            <property name="column-spacing">16</property>
+            <property name="row-spacing">4</property>
+            <property name="margin-top">8</property>""" + "".join(
+    _DETAIL_FIELD_XML.format(key=key, col=(i % 2) * 2, row=(i // 2) * 2, value_row=(i // 2) * 2 + 1,
+                             optional=key.startswith('geometry'))
+    for i, (key, _name) in enumerate(DETAIL_FIELDS)
+) + """
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkLabel" id="states_header">
+            <property name="halign">start</property>
+            <property name="margin-top">12</property>
+            <style><class name="detail-label"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkGrid">
+            <property name="column-spacing">16</property>
+            <property name="row-spacing">2</property>""" + "".join(
+    _DETAIL_STATE_XML.format(key=key, col=i % 2, row=i // 2)
+    for i, (key, _name) in enumerate(DETAIL_STATES)
+) + """
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkLabel" id="command_name">
+            <property name="halign">start</property>
+            <property name="margin-top">8</property>
+            <property name="no-show-all">True</property>
+            <style><class name="detail-label"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkLabel" id="command">
+            <property name="halign">start</property>
+            <property name="selectable">True</property>
+            <property name="wrap">True</property>
+            <property name="no-show-all">True</property>
+            <style><class name="detail-value"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+        <child>
+          <object class="GtkButton" id="kill_button">
+            <property name="margin-top">16</property>
+            <style><class name="destructive-action"/></style>
+          </object>
+          <packing><property name="expand">False</property><property name="fill">False</property></packing>
+        </child>
+      </object>
+      <packing><property name="name">details</property></packing>
+    </child>
+  </object>
+</interface>
+"""
+
+
+# Workspace column texts by workspace index, shared by all rows
+WORKSPACE_LABELS = tuple(sys.intern(str(i + 1)) for i in range(64))
+
+
+@lru_cache(maxsize=256)
+def _short_wm_class(wm_class):
+    """wm_class cut to the width of the workspace view's monitor column."""
+    return wm_class[:15]
+
+
+def _search_text(name, monitor, wm_class):
+    """Lowercased text of the filterable columns of a row.
+
+    The columns are joined by a newline, which filter text can't contain,
+    so a match never spans two columns.
+    """
+    return f"{name}\n{monitor}\n{wm_class}".lower()
 
 
 class WindowsTab:
@@ -21,12 +196,30 @@ class WindowsTab:
         self.parent = parent_window
         self.current_view = 'application'
         self.filter_text = ''
+        self._filter_lower = ''
 
         # Will be set during create()
         self.windows_tree = None
+        # Store and filter of the current view
         self.windows_store = None
         self.windows_filter = None
-        self.detail_box = None
+        # Store and filter per view, built when the view is first shown, and
+        # the views whose store was built before the last data change
+        self._stores = {}
+        self._filters = {}
+        self._stale_views = set()
+        # Per application the rows of the application view:
+        # wm_class -> (parent iter, child iters, parent values, child values)
+        self._app_rows = {}
+        # Formatted position and state badges per instance, by id(instance):
+        # (instance, position_str, states_str). Rebuilt by each population
+        # from the entries of instances still shown.
+        self._instance_texts = {}
+        self._next_instance_texts = {}
+        self.detail_stack = None
+        self._detail_widgets = {}
+        self._detail_states = {}
+        self._command_widgets = None
         self.app_view_btn = None
         self.ws_view_btn = None
         self.filter_entry = None
@@ -118,16 +311,7 @@ class WindowsTab:
 
     def _create_treeview(self):
         """Create TreeView for windows data."""
-        # TreeStore columns:
-        # 0=display_name, 1=workspace, 2=monitor, 3=position, 4=states,
-        # 5=is_parent, 6=wm_class, 7=instance_index
-        self.windows_store = Gtk.TreeStore(str, str, str, str, str, bool, str, int)
-
-        self._populate_store()
-
-        # Create filter model
-        self.windows_filter = self.windows_store.filter_new()
-        self.windows_filter.set_visible_func(self._filter_func)
+        self._switch_store()
 
         tree = Gtk.TreeView(model=self.windows_filter)
         tree.set_enable_tree_lines(True)
@@ -179,293 +363,370 @@ class WindowsTab:
 
         return tree
 
-    def _populate_store(self):
-        """Populate windows store based on current view."""
-        self.windows_store.clear()
+    def _switch_store(self):
+        """Show the store of the current view.
+
+        The store is built on first use and repopulated only if the data
+        changed since it was last shown, so toggling views does not rebuild
+        the rows of both.
+        """
+        view = self.current_view
+        if view not in self._stores:
+            # TreeStore columns:
+            # 0=display_name, 1=workspace, 2=monitor, 3=position, 4=states,
+            # 5=wm_class, 6=instance_index (-1 for parent rows),
+            # 7=search text (hidden), 8=visible (hidden, maintained by _refilter)
+            store = Gtk.TreeStore(str, str, str, str, str, str, int, str, bool)
+            windows_filter = store.filter_new()
+            # Rows are shown by their visible column; GTK reads it without
+            # calling back into Python per row
+            windows_filter.set_visible_column(8)
+            self._stores[view] = store
+            self._filters[view] = windows_filter
+            self._stale_views.add(view)
+
+        self.windows_store = self._stores[view]
+        self.windows_filter = self._filters[view]
+        if view in self._stale_views:
+            self._stale_views.discard(view)
+            self._populate_store()
+        # The filter text may have changed while the view was hidden
+        self._refilter()
 
-        if self.current_view == 'application':
-            self._populate_by_application()
-        else:
-            self._populate_by_workspace()
+        if self.windows_tree is not None:
+            # A new model drops all expanded state
+            self.windows_tree.set_model(self.windows_filter)
+            self.windows_tree.expand_all()
+
+    def _populate_store(self):
+        """Populate windows store based on current view.
+
+        Returns whether rows were added that the view shows collapsed.
+        """
+        # A full rebuild detaches the view, so it does not process every
+        # inserted row; in-place updates keep it (and its expanded rows)
+        rebuild = self.current_view == 'workspace' or not self._app_rows
+        tree = self.windows_tree
+        if not rebuild or tree is None or tree.get_model() is not self.windows_filter:
+            tree = None
+        if tree is not None:
+            tree.set_model(None)
+
+        new_parents = False
+        self._next_instance_texts = {}
+        try:
+            if self.current_view == 'application':
+                new_parents = self._populate_by_application()
+            else:
+                self.windows_store.clear()
+                self._populate_by_workspace()
+        finally:
+            if tree is not None:
+                tree.set_model(self.windows_filter)
+            self._instance_texts = self._next_instance_texts
+            self._next_instance_texts = {}
+
+        # Reattaching the model drops all expanded state
+        return rebuild or new_parents
+
+    def _update_rows(self):
+        """Repopulate and refilter the store, expanding new parent rows.
+
+        Called after the data changed; the stores of other views are
+        repopulated when they are shown next.
+        """
+        self._stale_views.update(self._stores.keys() - {self.current_view})
+        new_parents = self._populate_store()
+        revealed = self._refilter()
+        if new_parents or revealed:
+            self.windows_tree.expand_all()
 
     def _populate_by_application(self):
-        """Populate store grouped by application."""
+        """Populate store grouped by application.
+
+        Rows from the previous population are updated in place: only
+        changed columns are set, and only rows that were added or removed
+        are inserted or removed. Returns whether a parent row was added or
+        got its first children.
+        """
+        store = self.windows_store
         apps = self.data_manager.applications
-
-        for wm_class, app_data in sorted(apps.items()):
-            instances = app_data.get("instances", [])
-            instance_count = len(instances)
-
-            # Parent row
-            parent_iter = self.windows_store.append(None, [
-                f"{wm_class} ({instance_count})",
+        app_rows = self._app_rows
+        untitled = _("Untitled")
+        for wm_class in app_rows.keys() - apps.keys():
+            store.remove(app_rows.pop(wm_class)[0])
+
+        # Applications are kept sorted; a new one goes after its predecessor
+        prev_iter = None
+        new_parents = False
+        for wm_class in self.data_manager.sorted_app_keys:
+            instances = apps[wm_class].get("instances", [])
+            name = "%s (%d)" % (wm_class, len(instances))
+            parent_values = (
+                name,
                 "", "", "", "",
-                True, wm_class, -1
-            ])
+                wm_class, -1,
+                _search_text(name, "", wm_class), True
+            )
+            child_values = [
+                self._instance_row(wm_class, i, instance, untitled)
+                for i, instance in enumerate(instances)
+            ]
+
+            rows = app_rows.get(wm_class)
+            if rows is None:
+                parent_iter = store.insert_after(None, prev_iter, parent_values)
+                child_iters = [store.append(parent_iter, values) for values in child_values]
+                new_parents = True
+            else:
+                parent_iter, child_iters, old_parent_values, old_child_values = rows
+                if not child_iters and child_values:
+                    new_parents = True
+                self._update_row(parent_iter, old_parent_values, parent_values)
+                for row_iter, old_values, values in zip(child_iters, old_child_values, child_values):
+                    self._update_row(row_iter, old_values, values)
+
+                count = len(child_values)
+                for row_iter in child_iters[count:]:
+                    store.remove(row_iter)
+                child_iters = child_iters[:count] + [
+                    store.append(parent_iter, values)
+                    for values in child_values[len(child_iters):]
+                ]
+
+            app_rows[wm_class] = (parent_iter, child_iters, parent_values, child_values)
+            prev_iter = parent_iter
+
+        return new_parents
+
+    def _instance_row(self, wm_class, index, instance, untitled):
+        """Build the application view row values of a window instance.
+
+        untitled is the translated title of windows without one.
+        """
+        get = instance.get
+        title = get("title_snapshot") or untitled
+        title = title[:42] + "..." if len(title) > 45 else title
+
+        workspace = get("workspace", 0)
+        if 0 <= workspace < len(WORKSPACE_LABELS):
+            workspace_str = WORKSPACE_LABELS[workspace]
+        else:
+            workspace_str = str(workspace + 1)
+        monitor_str = get_monitor_display_name(get("monitor_id", ""), get("monitor_index", 0))
+
+        position_str, states_str = self._format_instance(instance)
+
+        name = "  " + title
+        return (
+            name,
+            workspace_str,
+            monitor_str,
+            position_str,
+            states_str,
+            wm_class, index,
+            _search_text(name, monitor_str, wm_class), True
+        )
 
-            # Child rows
-            for i, instance in enumerate(instances):
-                title = instance.get("title_snapshot", _("Untitled")) or _("Untitled")
-                if len(title) > 45:
-                    title = title[:42] + "..."
-
-                workspace = instance.get("workspace", 0)
-                workspace_str = str(workspace + 1)
-
-                monitor_id = instance.get("monitor_id", "")
-                monitor_idx = instance.get("monitor_index", 0)
-                monitor_str = get_monitor_display_name(monitor_id, monitor_idx)
-
-                position_str = format_position(instance)
-                states_str = get_state_badges(instance)
-
-                self.windows_store.append(parent_iter, [
-                    f"  {title}",
-                    workspace_str,
-                    monitor_str,
-                    position_str,
-                    states_str,
-                    False, wm_class, i
-                ])
+    def _format_instance(self, instance):
+        """Position and state badge texts of an instance.
+
+        They are formatted once per loaded instance and reused by later
+        populations. Instances are replaced, not changed, when data is
+        reloaded; the entry is checked to be for this very instance since
+        ids of dropped instances get reused.
+        """
+        key = id(instance)
+        texts = self._instance_texts.get(key)
+        if texts is None or texts[0] is not instance:
+            texts = (instance, format_position(instance), get_state_badges(instance))
+        self._next_instance_texts[key] = texts
+        return texts[1], texts[2]
+
+    def _update_row(self, row_iter, old_values, values):
+        """Set the columns of a store row whose values changed."""
+        if old_values == values:
+            return
+        columns = [col for col, (old, new) in enumerate(zip(old_values, values)) if old != new]
+        self.windows_store.set(row_iter, columns, [values[col] for col in columns])
 
     def _populate_by_workspace(self):
         """Populate store grouped by workspace."""
-        workspace_data = {}
+        # workspace -> monitor index -> [(wm_class, instance, index)]
+        workspace_data = defaultdict(lambda: defaultdict(list))
 
         apps = self.data_manager.applications
         for wm_class, app_data in apps.items():
             for i, instance in enumerate(app_data.get("instances", [])):
-                ws = instance.get("workspace", 0)
-                monitor_idx = instance.get("monitor_index", 0)
-
-                if ws not in workspace_data:
-                    workspace_data[ws] = {}
-                if monitor_idx not in workspace_data[ws]:
-                    workspace_data[ws][monitor_idx] = []
-
-                workspace_data[ws][monitor_idx].append({
-                    "wm_class": wm_class,
-                    "instance": instance,
-                    "index": i
-                })
-
-        for ws_index in sorted(workspace_data.keys()):
-            monitors = workspace_data[ws_index]
+                get = instance.get
+                workspace_data[get("workspace", 0)][get("monitor_index", 0)].append((wm_class, instance, i))
+
+        append = self.windows_store.append
+        untitled = _("Untitled")
+
+        for ws_index, monitors in sorted(workspace_data.items()):
             total_windows = sum(len(wins) for wins in monitors.values())
 
-            ws_iter = self.windows_store.append(None, [
-                _("Workspace {0} ({1} windows)").format(ws_index + 1, total_windows),
+            name = _("Workspace {0} ({1} windows)").format(ws_index + 1, total_windows)
+            ws_iter = append(None, [
+                name,
                 "", "", "", "",
-                True, "", -1
+                "", -1,
+                _search_text(name, "", ""), True
             ])
 
-            for monitor_idx in sorted(monitors.keys()):
-                windows = monitors[monitor_idx]
-
-                mon_iter = self.windows_store.append(ws_iter, [
-                    _("  Monitor {0} ({1} windows)").format(monitor_idx + 1, len(windows)),
+            for monitor_idx, windows in sorted(monitors.items()):
+                name = _("  Monitor {0} ({1} windows)").format(monitor_idx + 1, len(windows))
+                mon_iter = append(ws_iter, [
+                    name,
                     "", "", "", "",
-                    True, "", -1
+                    "", -1,
+                    _search_text(name, "", ""), True
                 ])
 
-                for win_data in windows:
-                    wm_class = win_data["wm_class"]
-                    instance = win_data["instance"]
-                    idx = win_data["index"]
+                for wm_class, instance, idx in windows:
+                    title = instance.get("title_snapshot") or untitled
+                    title = title[:32] + "..." if len(title) > 35 else title
 
-                    title = instance.get("title_snapshot", _("Untitled")) or _("Untitled")
-                    if len(title) > 35:
-                        title = title[:32] + "..."
+                    position_str, states_str = self._format_instance(instance)
 
-                    position_str = format_position(instance)
-                    states_str = get_state_badges(instance)
-
-                    self.windows_store.append(mon_iter, [
-                        f"    {title}",
+                    name = "    " + title
+                    monitor_str = _short_wm_class(wm_class)
+                    append(mon_iter, [
+                        name,
                         "",
-                        wm_class[:15],
+                        monitor_str,
                         position_str,
                         states_str,
-                        False, wm_class, idx
+                        wm_class, idx,
+                        _search_text(name, monitor_str, wm_class), True
                     ])
 
-    def _filter_func(self, model, iter, data):
-        """Filter function for TreeView."""
-        if not self.filter_text:
-            return True
-
-        filter_lower = self.filter_text.lower()
-
-        # Check if any column contains the filter text
-        for col in [0, 2, 6]:  # name, monitor, wm_class
-            value = model[iter][col]
-            if value and filter_lower in value.lower():
-                return True
-
-        # For parent rows, check if any child matches
-        if model[iter][5]:  # is_parent
-            child = model.iter_children(iter)
-            while child:
-                for col in [0, 2, 6]:
-                    value = model[child][col]
-                    if value and filter_lower in value.lower():
-                        return True
-                child = model.iter_next(child)
-
-        return False
+    def _refilter(self):
+        """Update the visible column of all rows for the filter text.
+
+        A row matches if its name, monitor or wm_class contains the text;
+        parent rows are also shown when anything below them matches. Only
+        rows whose visibility changes are written; the filter model picks
+        up each change by itself. Returns whether any row was shown again:
+        a parent row that reappears is shown collapsed, and a row that
+        reappears under a visible parent may sit under a collapsed one.
+        """
+        filter_lower = self._filter_lower
+        revealed = False
+
+        def visit(row):
+            nonlocal revealed
+            matched = filter_lower in row[7]
+            for child in row.iterchildren():
+                if visit(child):
+                    matched = True
+            if row[8] != matched:
+                row[8] = matched
+                if matched:
+                    revealed = True
+            return matched
+
+        for row in self.windows_store:
+            visit(row)
+        return revealed
 
     def _create_detail_pane(self):
-        """Create detail pane for selected window."""
+        """Create detail pane for selected window.
+
+        The pane is built once from DETAIL_UI_XML; a selection only sets the
+        texts of its labels.
+        """
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_size_request(260, -1)
         scrolled.get_style_context().add_class('detail-pane')
 
-        self.detail_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        scrolled.add(self.detail_box)
+        builder = Gtk.Builder.new_from_string(DETAIL_UI_XML, -1)
+        self.detail_stack = builder.get_object('detail_stack')
+        scrolled.add(self.detail_stack)
 
-        # Placeholder
-        self._show_placeholder()
+        builder.get_object('placeholder').set_text(_("Select a window to view details"))
+        builder.get_object('header').set_text(_("Window Details"))
+        builder.get_object('states_header').set_text(_("STATES"))
+        builder.get_object('command_name').set_text(_("COMMAND"))
 
-        return scrolled
+        # Field key -> (name label, value label)
+        self._detail_widgets = {}
+        for key, name in DETAIL_FIELDS:
+            name_label = builder.get_object(f'{key}_name')
+            name_label.set_text(_(name))
+            self._detail_widgets[key] = (name_label, builder.get_object(key))
 
-    def _show_placeholder(self):
-        """Show placeholder in detail pane."""
-        placeholder = Gtk.Label(label=_("Select a window to view details"))
-        placeholder.set_halign(Gtk.Align.CENTER)
-        placeholder.set_valign(Gtk.Align.CENTER)
-        self.detail_box.pack_start(placeholder, True, True, 0)
+        # Instance state key -> check mark label
+        self._detail_states = {}
+        for key, name in DETAIL_STATES:
+            builder.get_object(f'state_{key}_name').set_text(_(name))
+            self._detail_states[key] = builder.get_object(f'state_{key}')
+
+        self._command_widgets = (builder.get_object('command_name'), builder.get_object('command'))
+
+        kill_btn = builder.get_object('kill_button')
+        kill_btn.set_label(_("Close Window"))
+        kill_btn.connect("clicked", self._on_kill_clicked)
+
+        return scrolled
 
     def _update_detail_pane(self, instance, wm_class):
         """Update detail pane with instance info in 2-column layout."""
-        # Clear existing content
-        for child in self.detail_box.get_children():
-            self.detail_box.remove(child)
-
-        # Header
-        header = Gtk.Label(label=_("Window Details"))
-        header.set_halign(Gtk.Align.START)
-        header.get_style_context().add_class('detail-header')
-        self.detail_box.pack_start(header, False, False, 0)
-
-        # 2-column grid for details
-        grid = Gtk.Grid()
-        grid.set_column_spacing(16)
-        grid.set_row_spacing(4)
-        grid.set_margin_top(8)
-        self.detail_box.pack_start(grid, False, False, 0)
-
-        # Details - will be arranged in 2 columns
-        details = [
-            (_("APPLICATION"), wm_class),
-            (_("WORKSPACE"), str(instance.get("workspace", 0) + 1)),
-            (_("TITLE"), (instance.get("title_snapshot", _("Untitled")) or _("Untitled"))[:35]),
-            (_("MONITOR INDEX"), str(instance.get("monitor_index", 0))),
-            (_("X11 WINDOW ID"), instance.get("x11_window_id", "N/A")),
-            (_("STABLE SEQ"), str(instance.get("stable_sequence", "N/A"))),
-        ]
-
-        geom = instance.get("geometry_absolute", {})
+        widgets = self._detail_widgets
+        widgets['application'][1].set_text(wm_class)
+        widgets['workspace'][1].set_text("%d" % (instance.get("workspace", 0) + 1))
+        widgets['title'][1].set_text((instance.get("title_snapshot") or _("Untitled"))[:35])
+        widgets['monitor_index'][1].set_text("%d" % instance.get("monitor_index", 0))
+        widgets['x11_window_id'][1].set_text(instance.get("x11_window_id") or "N/A")
+        widgets['stable_sequence'][1].set_text("%s" % instance.get("stable_sequence", "N/A"))
+
+        # Geometry fields are hidden for windows without one
+        geom = instance.get("geometry_absolute")
         if geom:
-            details.append((_("GEOMETRY"), f"{geom.get('x', 0)},{geom.get('y', 0)} {geom.get('width', 0)}x{geom.get('height', 0)}"))
-
-        geom_pct = instance.get("geometry_percent", {})
+            widgets['geometry'][1].set_text("%s,%s %sx%s" % (
+                geom.get('x', 0), geom.get('y', 0), geom.get('width', 0), geom.get('height', 0)))
+        geom_pct = instance.get("geometry_percent")
         if geom_pct:
-            details.append((_("GEOMETRY %"), f"{geom_pct.get('x', 0)*100:.0f}%,{geom_pct.get('y', 0)*100:.0f}% {geom_pct.get('width', 0)*100:.0f}%x{geom_pct.get('height', 0)*100:.0f}%"))
-
-        # Add details to grid in 2-column layout
-        for i, (label_text, value) in enumerate(details):
-            col = (i % 2) * 2  # 0 or 2 (label columns are 0,2; value columns follow)
-            row = i // 2
-
-            label = Gtk.Label(label=label_text)
-            label.set_halign(Gtk.Align.START)
-            label.get_style_context().add_class('detail-label')
-            grid.attach(label, col, row * 2, 1, 1)
-
-            value_label = Gtk.Label(label=str(value))
-            value_label.set_halign(Gtk.Align.START)
-            value_label.set_selectable(True)
-            value_label.set_line_wrap(True)
-            value_label.set_max_width_chars(18)
-            value_label.set_ellipsize(Pango.EllipsizeMode.END)
-            value_label.get_style_context().add_class('detail-value')
-            grid.attach(value_label, col, row * 2 + 1, 1, 1)
-
-        # States section - also 2-column
-        states_label = Gtk.Label(label=_("STATES"))
-        states_label.set_halign(Gtk.Align.START)
-        states_label.get_style_context().add_class('detail-label')
-        states_label.set_margin_top(12)
-        self.detail_box.pack_start(states_label, False, False, 0)
-
-        states_grid = Gtk.Grid()
-        states_grid.set_column_spacing(16)
-        states_grid.set_row_spacing(2)
-        self.detail_box.pack_start(states_grid, False, False, 0)
-
-        states = [
-            (_("Maximized"), instance.get("maximized", False)),
-            (_("Fullscreen"), instance.get("fullscreen", False)),
-            (_("Sticky"), instance.get("sticky", False)),
-            (_("Always on Top"), instance.get("alwaysOnTop", False)),
-            (_("Shaded"), instance.get("shaded", False)),
-            (_("Minimized"), instance.get("minimized", False)),
-        ]
-
-        for i, (state_name, state_value) in enumerate(states):
-            col = i % 2
-            row = i // 2
-
-            state_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-
-            check = Gtk.Label(label="✓" if state_value else "✗")
-            check.get_style_context().add_class('status-active' if state_value else 'status-inactive')
-            state_box.pack_start(check, False, False, 0)
-
-            state_label = Gtk.Label(label=state_name)
-            state_label.set_halign(Gtk.Align.START)
-            state_box.pack_start(state_label, False, False, 0)
-
-            states_grid.attach(state_box, col, row, 1, 1)
+            widgets['geometry_percent'][1].set_text("%.0f%%,%.0f%% %.0f%%x%.0f%%" % (
+                geom_pct.get('x', 0) * 100, geom_pct.get('y', 0) * 100,
+                geom_pct.get('width', 0) * 100, geom_pct.get('height', 0) * 100))
+        for key, shown in (('geometry', bool(geom)), ('geometry_percent', bool(geom_pct))):
+            for label in widgets[key]:
+                label.set_visible(shown)
+
+        for key, check in self._detail_states.items():
+            state_value = bool(instance.get(key, False))
+            mark, style_class = STATE_MARKS[state_value]
+            if check.get_text() == mark:
+                # Same state as the previous window: changing the style
+                # classes would only restyle the label again
+                continue
+            check.set_text(mark)
+            context = check.get_style_context()
+            context.remove_class(STATE_MARKS[not state_value][1])
+            context.add_class(style_class)
 
         # Command line (full width at bottom if exists)
         cmd = instance.get("cmdline", "")
+        cmd_label, cmd_value = self._command_widgets
         if cmd:
-            cmd_label = Gtk.Label(label=_("COMMAND"))
-            cmd_label.set_halign(Gtk.Align.START)
-            cmd_label.get_style_context().add_class('detail-label')
-            cmd_label.set_margin_top(8)
-            self.detail_box.pack_start(cmd_label, False, False, 0)
-
-            cmd_value = Gtk.Label(label=cmd[:60])
-            cmd_value.set_halign(Gtk.Align.START)
-            cmd_value.set_selectable(True)
-            cmd_value.set_line_wrap(True)
-            cmd_value.get_style_context().add_class('detail-value')
-            self.detail_box.pack_start(cmd_value, False, False, 0)
+            cmd_value.set_text(cmd[:60])
+        cmd_label.set_visible(bool(cmd))
+        cmd_value.set_visible(bool(cmd))
 
         # Store current instance for kill button
         self._current_wm_class = wm_class
         self._current_instance = instance
 
-        # Kill Process button
-        kill_btn = Gtk.Button(label=_("Close Window"))
-        kill_btn.set_margin_top(16)
-        kill_btn.get_style_context().add_class('destructive-action')
-        kill_btn.connect("clicked", self._on_kill_clicked)
-        self.detail_box.pack_start(kill_btn, False, False, 0)
-
-        self.detail_box.show_all()
+        self.detail_stack.set_visible_child_name('details')
 
     def _clear_detail_pane(self):
         """Clear detail pane."""
-        for child in self.detail_box.get_children():
-            self.detail_box.remove(child)
-        self._show_placeholder()
         self._current_wm_class = None
         self._current_instance = None
-        self.detail_box.show_all()
+        self.detail_stack.set_visible_child_name('placeholder')
 
     def _on_kill_clicked(self, widget):
         """Kill/close the currently selected window using wmctrl."""
@@ -504,46 +765,47 @@ class WindowsTab:
             return
 
         try:
-            # Use wmctrl to close window gracefully (-c = close)
-            result = subprocess.run(
+            # Use wmctrl to close window gracefully (-c = close); only its
+            # exit matters, and the UI keeps running meanwhile
+            proc = Gio.Subprocess.new(
                 ["wmctrl", "-i", "-c", x11_window_id],
-                capture_output=True,
-                text=True
+                Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE
             )
-
-            if result.returncode == 0:
-                # Success - refresh the view
-                self.data_manager.reload()
-                self._populate_store()
-                self._clear_detail_pane()
+        except GLib.Error as e:
+            if e.matches(GLib.spawn_error_quark(), GLib.SpawnError.NOENT):
+                dialog = Gtk.MessageDialog(
+                    transient_for=self.parent,
+                    flags=0,
+                    message_type=Gtk.MessageType.ERROR,
+                    buttons=Gtk.ButtonsType.OK,
+                    text=_("wmctrl not found")
+                )
+                dialog.format_secondary_text(_("Please install wmctrl: sudo apt install wmctrl"))
             else:
-                # Window might not exist anymore - that's OK
-                self.data_manager.reload()
-                self._populate_store()
-                self._clear_detail_pane()
-
-        except FileNotFoundError:
-            dialog = Gtk.MessageDialog(
-                transient_for=self.parent,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text=_("wmctrl not found")
-            )
-            dialog.format_secondary_text(_("Please install wmctrl: sudo apt install wmctrl"))
-            dialog.run()
-            dialog.destroy()
-        except Exception as e:
-            dialog = Gtk.MessageDialog(
-                transient_for=self.parent,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text=_("Error closing window")
-            )
-            dialog.format_secondary_text(str(e))
+                dialog = Gtk.MessageDialog(
+                    transient_for=self.parent,
+                    flags=0,
+                    message_type=Gtk.MessageType.ERROR,
+                    buttons=Gtk.ButtonsType.OK,
+                    text=_("Error closing window")
+                )
+                dialog.format_secondary_text(e.message)
             dialog.run()
             dialog.destroy()
+            return
+
+        proc.wait_async(None, self._on_wmctrl_done)
+
+    def _on_wmctrl_done(self, proc, result):
+        """Refresh the view once wmctrl has exited."""
+        try:
+            proc.wait_finish(result)
+        except GLib.Error:
+            pass
+        # Even if wmctrl failed the window might not exist anymore - that's OK
+        self.data_manager.reload()
+        self._update_rows()
+        self._clear_detail_pane()
 
     # Event handlers
 
@@ -551,16 +813,26 @@ class WindowsTab:
         """Handle view toggle."""
         if widget.get_active():
             self.current_view = 'application' if widget == self.app_view_btn else 'workspace'
-            self._populate_store()
-            self.windows_filter.refilter()
-            self.windows_tree.expand_all()
+            self._switch_store()
             self._clear_detail_pane()
 
     def _on_filter_changed(self, entry):
-        """Handle filter text changes."""
+        """Handle filter text changes.
+
+        Gtk.SearchEntry already emits search-changed only after a short
+        typing pause, so there is no extra debounce here.
+        """
         self.filter_text = entry.get_text()
-        self.windows_filter.refilter()
-        if self.filter_text:
+        filter_lower = self.filter_text.lower()
+        if filter_lower == self._filter_lower:
+            # Matching ignores case, the visible rows stay the same
+            return
+        # Starting to filter expands everything, as before, so matches under
+        # collapsed parents show; later changes only expand for rows that
+        # became visible again
+        started = filter_lower and not self._filter_lower
+        self._filter_lower = filter_lower
+        if (self._refilter() or started) and filter_lower:
             self.windows_tree.expand_all()
 
     def _on_selection_changed(self, selection):
@@ -570,13 +842,13 @@ class WindowsTab:
             self._clear_detail_pane()
             return
 
-        is_parent = model[treeiter][5]
-        if is_parent:
+        if model[treeiter][6] < 0:
+            # Application, workspace or monitor row
             self._clear_detail_pane()
             return
 
-        wm_class = model[treeiter][6]
-        instance_index = model[treeiter][7]
+        wm_class = model[treeiter][5]
+        instance_index = model[treeiter][6]
 
         if wm_class and instance_index >= 0:
             app_data = self.data_manager.applications.get(wm_class)
@@ -595,9 +867,9 @@ class WindowsTab:
         if treeiter is None:
             return
 
-        is_parent = model[treeiter][5]
-        wm_class = model[treeiter][6]
-        instance_index = model[treeiter][7]
+        wm_class = model[treeiter][5]
+        instance_index = model[treeiter][6]
+        is_parent = instance_index < 0
 
         if is_parent and wm_class:
             # Delete entire app
@@ -612,12 +884,9 @@ class WindowsTab:
             dialog.destroy()
 
             if response == Gtk.ResponseType.YES:
-                if wm_class in self.data_manager.data.get("applications", {}):
-                    del self.data_manager.data["applications"][wm_class]
-                    self.data_manager.save()
-                    self._populate_store()
-                    self.windows_filter.refilter()
-                    self.windows_tree.expand_all()
+                if self.data_manager.remove_application(wm_class):
+                    self.data_manager.schedule_save()
+                    self._update_rows()
 
         elif not is_parent and wm_class and instance_index >= 0:
             # Delete single instance
@@ -634,18 +903,12 @@ class WindowsTab:
                 dialog.destroy()
 
                 if response == Gtk.ResponseType.YES:
-                    app_data["instances"].pop(instance_index)
-                    if len(app_data["instances"]) == 0:
-                        del self.data_manager.data["applications"][wm_class]
-                    self.data_manager.save()
-                    self._populate_store()
-                    self.windows_filter.refilter()
-                    self.windows_tree.expand_all()
+                    self.data_manager.remove_instance(wm_class, instance_index)
+                    self.data_manager.schedule_save()
+                    self._update_rows()
                     self._clear_detail_pane()
 
     def refresh(self):
         """Refresh the tab data."""
-        self._populate_store()
-        self.windows_filter.refilter()
-        self.windows_tree.expand_all()
+        self._update_rows()
         self._clear_detail_pane()
@@ -4,14 +4,13 @@ Utility functions and classes for Window Position Remember Settings UI
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, Gio
 import json
 import os
-import subprocess
-import gettext
+import tempfile
+from functools import lru_cache
 
-# Translation function
-_ = gettext.gettext
+from .i18n import _
 
 # Constants
 UUID = "remember@thechief"
@@ -20,163 +19,384 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, 'positions.json')
 APPLET_UUID = "remember-applet@thechief"
 APPLET_DIR = os.path.join(GLib.get_home_dir(), '.local', 'share', 'cinnamon', 'applets', APPLET_UUID)
 
+# Delay for writing position data after a change, so a burst of changes is saved once
+SAVE_DELAY_MS = 300
+
+# Encoder for position data, created once for all saves
+_POSITIONS_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
 
 class DataManager:
     """Handles loading and saving of position data."""
 
+    __slots__ = (
+        'data', 'applications', 'monitors', 'settings',
+        '_file_signature', '_modified', '_save_source',
+        '_instance_count', '_sorted_app_keys',
+    )
+
     def __init__(self):
-        self.data = self.load()
+        # (mtime_ns, size) of the file when self.data was read or written,
+        # and whether self.data was changed here since
+        self._file_signature = None
+        self._modified = False
+        self._save_source = 0
+        self.reload()
+
+    @staticmethod
+    def _stat_signature():
+        """(mtime_ns, size) of the data file, or None if it can't be read."""
+        try:
+            st = os.stat(CONFIG_FILE)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def load(self):
         """Load position data from JSON file."""
-        if not os.path.exists(CONFIG_FILE):
-            return {"version": 3, "monitors": {}, "applications": {}, "settings": {}}
-
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            # json.loads takes the raw UTF-8 bytes, no text layer needed.
+            # read() sizes its buffer from fstat, so the file is copied once.
+            with open(CONFIG_FILE, 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading data: {e}")
-            return {"version": 3, "monitors": {}, "applications": {}, "settings": {}}
+        return {"version": 3, "monitors": {}, "applications": {}, "settings": {}}
 
     def save(self):
-        """Save position data to JSON file."""
+        """Save position data to JSON file.
+
+        Nothing is encoded or written if the data is unchanged since it was
+        last read or written.
+        """
+        if self._save_source:
+            GLib.source_remove(self._save_source)
+            self._save_source = 0
+        if not self._modified:
+            return True
         os.makedirs(CONFIG_DIR, exist_ok=True)
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Encode in one go and write once: json.dump writes every token
+            # of the document with its own write() call, and encode() is the
+            # only path that uses the C encoder. The extension reads this
+            # file too, so it must never see it half written. No
+            # indentation, the file is machine-read; the extension's own
+            # writes still indent it.
+            text = _POSITIONS_ENCODER.encode(self.data)
+            atomic_write(CONFIG_FILE, text.encode('utf-8'))
+            self._file_signature = self._stat_signature()
+            self._modified = False
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
 
+    def schedule_save(self):
+        """Save the data shortly after, once for a burst of changes."""
+        if self._save_source == 0:
+            self._save_source = GLib.timeout_add(SAVE_DELAY_MS, self.flush)
+
+    def flush(self, *args):
+        """Save now if a save is scheduled (timeout callback and on teardown)."""
+        if self._save_source:
+            self.save()
+        return False
+
     def reload(self):
-        """Reload data from file."""
+        """Reload data from file.
+
+        The file is only parsed again if it changed since it was last read
+        or written here, or if the data was changed here without saving.
+        A scheduled save is written first, so it is not lost.
+        """
+        self.flush()
+        signature = self._stat_signature()
+        if signature is not None and signature == self._file_signature and not self._modified:
+            return self.data
+        # Stat before reading: a write in between makes the next reload
+        # read the file again
+        self._file_signature = signature
+        self._modified = False
         self.data = self.load()
+        # Sections of self.data as plain attributes, rebound when self.data
+        # or one of them is replaced
+        self.applications = self.data.get("applications", {})
+        self.monitors = self.data.get("monitors", {})
+        self.settings = self.data.setdefault("settings", {})
+        # Kept current by the mutation methods below
+        self._instance_count = sum(
+            len(app.get("instances", [])) for app in self.applications.values()
+        )
+        # Sorted on first use, then kept current by the mutation methods
+        self._sorted_app_keys = None
         return self.data
 
-    @property
-    def applications(self):
-        return self.data.get("applications", {})
+    def _forget_application(self, wm_class):
+        """Drop a removed application from the sorted application keys."""
+        if self._sorted_app_keys is not None:
+            self._sorted_app_keys.remove(wm_class)
+
+    def remove_application(self, wm_class):
+        """Remove an application with all its instances (not saved yet)."""
+        app_data = self.applications.pop(wm_class, None)
+        if app_data is None:
+            return False
+        self._modified = True
+        self._instance_count -= len(app_data.get("instances", []))
+        self._forget_application(wm_class)
+        return True
+
+    def remove_instance(self, wm_class, index):
+        """Remove one instance, and its application if it was the last one."""
+        app_data = self.applications[wm_class]
+        instance = app_data["instances"].pop(index)
+        self._modified = True
+        self._instance_count -= 1
+        if not app_data["instances"]:
+            del self.applications[wm_class]
+            self._forget_application(wm_class)
+        return instance
+
+    def clear_applications(self):
+        """Remove all applications (not saved yet)."""
+        self.data["applications"] = self.applications = {}
+        self._modified = True
+        self._instance_count = 0
+        self._sorted_app_keys = []
 
     @property
-    def monitors(self):
-        return self.data.get("monitors", {})
+    def sorted_app_keys(self):
+        """wm_classes of all applications in sorted order."""
+        if self._sorted_app_keys is None:
+            self._sorted_app_keys = sorted(self.applications)
+        return self._sorted_app_keys
 
     @property
-    def settings(self):
-        if 'settings' not in self.data:
-            self.data['settings'] = {}
-        return self.data['settings']
+    def total_instances(self):
+        """Number of saved window instances over all applications."""
+        return self._instance_count
 
     @property
     def version(self):
         return self.data.get("version", "?")
 
 
+def _replacement_mode(path):
+    """Permission bits for a file that replaces path.
+
+    The existing file's mode, or what open() would create under the
+    current umask if path does not exist yet.
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write(path, data):
+    """Write str or bytes to path via a temp file and rename.
+
+    Readers never observe a partially written file; the temp file is
+    created next to the target so os.replace() stays on one filesystem.
+    The target keeps its permissions (mkstemp would leave it at 0600).
+    """
+    mode = _replacement_mode(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Session bus connection, opened on first use
+_session_bus = None
+
+
 def run_cinnamon_js(code):
-    """Run JavaScript code via Cinnamon's DBus interface."""
+    """Run JavaScript code via Cinnamon's DBus interface.
+
+    The call goes over one shared session bus connection instead of a
+    dbus-send process per call, and does not wait for Cinnamon's reply.
+    """
+    global _session_bus
     try:
-        subprocess.run([
-            'dbus-send', '--session', '--type=method_call',
-            '--dest=org.Cinnamon',
-            '/org/Cinnamon',
-            'org.Cinnamon.Eval',
-            f'string:{code}'
-        ], check=False)
+        if _session_bus is None:
+            _session_bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        _session_bus.call(
+            'org.Cinnamon', '/org/Cinnamon', 'org.Cinnamon', 'Eval',
+            GLib.Variant('(s)', (code,)), None,
+            Gio.DBusCallFlags.NONE, -1, None, None, None
+        )
         return True
-    except Exception as e:
-        print(f"Error running JS: {e}")
+    except GLib.Error as e:
+        print(f"Error running JS: {e.message}")
         return False
 
 
 def show_message(parent, title, message, msg_type=Gtk.MessageType.INFO):
-    """Show a message dialog."""
+    """Show a message dialog.
+
+    Returns right away; the dialog is modal and destroys itself when
+    dismissed, without a nested main loop waiting for it.
+    """
     dialog = Gtk.MessageDialog(
         transient_for=parent,
-        flags=0,
+        modal=True,
         message_type=msg_type,
         buttons=Gtk.ButtonsType.OK,
         text=title
     )
     dialog.format_secondary_text(message)
-    dialog.run()
-    dialog.destroy()
+    dialog.connect("response", lambda d, _response: d.destroy())
+    dialog.show_all()
 
 
 def open_url(url):
-    """Open URL in appropriate browser."""
+    """Open URL in appropriate browser.
+
+    Browsers are started with Gio.Subprocess, which reaps them when they
+    exit without anything waiting for them here.
+    """
     try:
         if url.startswith("brave://"):
-            subprocess.Popen(['brave-browser', url])
+            Gio.Subprocess.new(['brave-browser', url], Gio.SubprocessFlags.NONE)
         elif url.startswith("chrome://"):
-            subprocess.Popen(['google-chrome', url])
+            Gio.Subprocess.new(['google-chrome', url], Gio.SubprocessFlags.NONE)
         elif url.startswith("about:"):
-            subprocess.Popen(['firefox', url])
+            Gio.Subprocess.new(['firefox', url], Gio.SubprocessFlags.NONE)
         else:
-            subprocess.Popen(['xdg-open', url])
+            Gio.AppInfo.launch_default_for_uri(url, None)
         return True
     except Exception as e:
         print(f"Error opening URL: {e}")
         return False
 
 
+# Positions shown as a state instead of a geometry: key -> (color, msgid)
+POSITION_STATES = {
+    'maximized': ('#3584e4', "Maximized"),
+    'fullscreen': ('#26a269', "Fullscreen"),
+    'none': ('#888888', "No position"),
+}
+
+
+@lru_cache(maxsize=None)
+def _position_state_markup(key):
+    """Pango markup of a position state, translated and built once."""
+    color, msgid = POSITION_STATES[key]
+    return f'<span color="{color}">{_(msgid)}</span>'
+
+
 def format_position(instance):
     """Format position info compactly with Pango markup."""
-    if instance.get("maximized"):
-        return f'<span color="#3584e4">{_("Maximized")}</span>'
-    if instance.get("fullscreen"):
-        return f'<span color="#26a269">{_("Fullscreen")}</span>'
+    get = instance.get
+    if get("maximized"):
+        return _position_state_markup('maximized')
+    if get("fullscreen"):
+        return _position_state_markup('fullscreen')
 
-    geom = instance.get("geometry_absolute", {})
+    geom = get("geometry_absolute")
     if not geom:
-        return f'<span color="#888888">{_("No position")}</span>'
+        return _position_state_markup('none')
 
-    x = geom.get('x', 0)
-    y = geom.get('y', 0)
-    w = geom.get('width', 0)
-    h = geom.get('height', 0)
+    get = geom.get
+    return '%s,%s %sx%s' % (get('x', 0), get('y', 0), get('width', 0), get('height', 0))
 
-    return f'{x},{y} {w}x{h}'
 
+# State badge letters in display order; bit i of a state mask is STATE_BADGES[i]
+STATE_BADGES = (('sticky', 'S'), ('alwaysOnTop', 'T'), ('fullscreen', 'F'), ('shaded', 'R'))
 
-def get_state_badges(instance):
-    """Generate state badge string."""
-    badges = []
+# Badge string for every state mask
+_STATE_BADGE_TABLE = tuple(
+    ' '.join(letter for bit, (_key, letter) in enumerate(STATE_BADGES) if mask >> bit & 1)
+    for mask in range(1 << len(STATE_BADGES))
+)
 
-    if instance.get('sticky'):
-        badges.append('S')
-    if instance.get('alwaysOnTop'):
-        badges.append('T')
-    if instance.get('fullscreen'):
-        badges.append('F')
-    if instance.get('shaded'):
-        badges.append('R')
 
-    return ' '.join(badges) if badges else ''
+def get_state_badges(instance):
+    """Generate state badge string."""
+    get = instance.get
+    mask = (bool(get('sticky'))
+            | bool(get('alwaysOnTop')) << 1
+            | bool(get('fullscreen')) << 2
+            | bool(get('shaded')) << 3)
+    return _STATE_BADGE_TABLE[mask]
 
 
+@lru_cache(maxsize=128)
 def get_monitor_display_name(monitor_id, monitor_idx):
-    """Get a display-friendly monitor name."""
+    """Get a display-friendly monitor name.
+
+    Cached: every window row asks for one of a handful of monitors.
+    """
     if monitor_id.startswith("edid:"):
         return f"M{monitor_idx + 1}"
     elif monitor_id.startswith("connector:"):
-        connector = monitor_id.split(":")[1] if ":" in monitor_id else ""
+        # Name up to the next colon, if any
+        connector = monitor_id[10:].partition(":")[0]
         return connector[:8] if connector else f"M{monitor_idx + 1}"
     else:
         return f"M{monitor_idx + 1}"
 
 
+# Layout of a settings row; texts and state are set per row
+SETTINGS_ROW_UI_XML = """
+<interface>
+  <object class="GtkBox" id="row">
+    <property name="orientation">horizontal</property>
+    <property name="spacing">8</property>
+    <style><class name="settings-row"/></style>
+    <child>
+      <object class="GtkLabel" id="label">
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="expand">True</property><property name="fill">True</property></packing>
+    </child>
+    <child>
+      <object class="GtkButton" id="tooltip">
+        <property name="label">?</property>
+        <property name="relief">none</property>
+        <style><class name="tooltip-icon"/></style>
+      </object>
+      <packing><property name="expand">False</property><property name="fill">False</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="switch"/>
+      <packing><property name="expand">False</property><property name="fill">False</property></packing>
+    </child>
+  </object>
+</interface>
+"""
+
+
+def _make_label(text, style_class=None):
+    """Create a start-aligned label, optionally with a style class."""
+    label = Gtk.Label(label=text, halign=Gtk.Align.START)
+    if style_class:
+        label.get_style_context().add_class(style_class)
+    return label
+
+
 class WidgetFactory:
     """Factory for creating common widgets with consistent styling."""
 
     @staticmethod
     def create_section_header(text):
         """Create a section header label."""
-        header = Gtk.Label(label=text)
-        header.set_halign(Gtk.Align.START)
-        header.get_style_context().add_class('section-header')
-        return header
+        return _make_label(text, 'section-header')
 
     @staticmethod
     def create_stat_card(title, value, subtitle):
@@ -184,20 +404,9 @@ class WidgetFactory:
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         card.get_style_context().add_class('stat-card')
 
-        title_label = Gtk.Label(label=title.upper())
-        title_label.set_halign(Gtk.Align.START)
-        title_label.get_style_context().add_class('stat-title')
-        card.pack_start(title_label, False, False, 0)
-
-        value_label = Gtk.Label(label=str(value))
-        value_label.set_halign(Gtk.Align.START)
-        value_label.get_style_context().add_class('stat-value')
-        card.pack_start(value_label, False, False, 0)
-
-        subtitle_label = Gtk.Label(label=subtitle)
-        subtitle_label.set_halign(Gtk.Align.START)
-        subtitle_label.get_style_context().add_class('stat-subtitle')
-        card.pack_start(subtitle_label, False, False, 0)
+        card.pack_start(_make_label(title.upper(), 'stat-title'), False, False, 0)
+        card.pack_start(_make_label(str(value), 'stat-value'), False, False, 0)
+        card.pack_start(_make_label(subtitle, 'stat-subtitle'), False, False, 0)
 
         return card
 
@@ -211,9 +420,7 @@ class WidgetFactory:
         dot.get_style_context().add_class('status-active' if is_active else 'status-inactive')
         box.pack_start(dot, False, False, 0)
 
-        label = Gtk.Label(label=label_text)
-        label.set_halign(Gtk.Align.START)
-        box.pack_start(label, True, True, 0)
+        box.pack_start(_make_label(label_text), True, True, 0)
 
         if action_button:
             box.pack_end(action_button, False, False, 0)
@@ -244,24 +451,12 @@ class WidgetFactory:
     @staticmethod
     def create_settings_row(key, label_text, tooltip, default_value, settings_dict, on_changed):
         """Create a settings row with label, tooltip, and switch."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        row.get_style_context().add_class('settings-row')
-
-        label = Gtk.Label(label=label_text)
-        label.set_halign(Gtk.Align.START)
-        row.pack_start(label, True, True, 0)
-
-        # Tooltip icon
-        tooltip_btn = Gtk.Button(label="?")
-        tooltip_btn.set_relief(Gtk.ReliefStyle.NONE)
-        tooltip_btn.get_style_context().add_class('tooltip-icon')
-        tooltip_btn.set_tooltip_text(tooltip)
-        row.pack_start(tooltip_btn, False, False, 0)
-
-        # Switch
-        switch = Gtk.Switch()
+        builder = Gtk.Builder.new_from_string(SETTINGS_ROW_UI_XML, -1)
+        builder.get_object('label').set_text(label_text)
+        builder.get_object('tooltip').set_tooltip_text(tooltip)
+
+        switch = builder.get_object('switch')
         switch.set_active(settings_dict.get(key, default_value))
         switch.connect("notify::active", lambda sw, _, k=key: on_changed(k, sw.get_active()))
-        row.pack_start(switch, False, False, 0)
 
-        return row
+        return builder.get_object('row')